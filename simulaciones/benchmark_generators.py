@@ -0,0 +1,159 @@
+# benchmark_generators.py
+"""Rendimiento y calidad estadística de los samplers de RandomGenerators.
+
+Mide muestras/s y pico de memoria (tracemalloc) de cada distribución del registro en
+varios tamaños y regímenes de parámetros, y contrasta una muestra de cada régimen con
+su ley analítica (KS y chi-cuadrado agrupados). El resultado se guarda en JSON para
+poder comparar entre commits.
+
+Ejemplos:
+    python benchmark_generators.py -o bench.json
+    python benchmark_generators.py --max-size 1e6 --only poisson binomial
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from random_generators import DISTRIBUTION_REGISTRY
+from random_stream import RandomStream
+from sample_stats import StreamingHistogram, binned_chi_square, binned_ks
+
+SIZES = tuple(10 ** e for e in range(3, 9))
+QUALITY_SIZE = 10 ** 6
+
+# Regímenes por distribución; cada uno ejercita un camino distinto del sampler
+REGIMES = {
+    'uniform': [{}],
+    'exponential': [{'lam': 1.0}, {'lam': 1e-3}, {'lam': 1e3}],
+    # k <= 12 usa el producto de uniformes y k > 12 delega en gamma: 8/12 frente a 13/16
+    # muestra el punto de cruce que fija _ERLANG_GAMMA_THRESHOLD
+    'erlang': [{'k': 2}, {'k': 8}, {'k': 12}, {'k': 13}, {'k': 16}, {'k': 200}],
+    'gamma': [{'shape': 0.1}, {'shape': 0.5}, {'shape': 2.0}, {'shape': 100.0}],
+    'normal': [{}],
+    'weibull': [{'k': 0.5}, {'k': 1.5}, {'k': 5.0}],
+    'bernoulli': [{'p': 0.3}],
+    'binomial': [{'n': 10, 'p': 0.3}, {'n': 200, 'p': 0.3}, {'n': 10 ** 6, 'p': 0.4}, {'n': 10 ** 9, 'p': 1e-6}],
+    'poisson': [{'lam': 1e-3}, {'lam': 4.0}, {'lam': 30.0}, {'lam': 1e6}],
+    'discrete': [{'pmf': '0.1;0.2;0.3;0.4'}, {'pmf': ';'.join(['1'] * 1000)}],
+}
+
+
+def _regimes(name):
+    return REGIMES.get(name, [{}])
+
+
+def _time_sample(spec, params, size, repeat, seed):
+    out = np.empty(size, dtype=spec.dtype)
+    best = float('inf')
+    for i in range(repeat):
+        rng = RandomStream([seed, i])
+        start = time.perf_counter()
+        spec.sample(rng=rng, out=out, **params)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_memory(spec, params, size, seed):
+    # Sin out=: cuenta también la salida, como la usa el resto del proyecto
+    tracemalloc.start()
+    try:
+        spec.sample(size, rng=RandomStream(seed), **params)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(spec, params, sizes, repeat=3, seed=0):
+    rows = []
+    for size in sizes:
+        seconds = _time_sample(spec, params, size, repeat, seed)
+        peak = _peak_memory(spec, params, size, seed)
+        rows.append({'size': size, 'seconds': seconds,
+                     'samples_per_sec': size / seconds if seconds > 0 else float('inf'),
+                     'peak_bytes': peak, 'bytes_per_sample': peak / size})
+    return rows
+
+
+def quality(spec, params, size=QUALITY_SIZE, seed=0, chunk=2**20):
+    hist = StreamingHistogram(bins=spec.bins)
+    gen = RandomStream(seed)
+    remaining = size
+    while remaining:
+        m = min(chunk, remaining)
+        hist.update(spec.sample(m, rng=gen, **params))
+        remaining -= m
+    cdf = lambda x: spec.cdf(x, params)
+    d, p_ks = binned_ks(hist, cdf)
+    chi2, dof, p_chi2 = binned_chi_square(hist, cdf)
+    return {'n': size, 'mean': hist.mean, 'expected_mean': spec.mean(params),
+            'variance': hist.variance, 'expected_variance': spec.variance(params),
+            'ks_d': d, 'ks_p': p_ks, 'chi2': chi2, 'chi2_dof': dof, 'chi2_p': p_chi2}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(sizes=SIZES, only=None, repeat=3, quality_size=QUALITY_SIZE, seed=0, log=None):
+    results = []
+    for name, spec in DISTRIBUTION_REGISTRY.items():
+        if only and name not in only:
+            continue
+        for raw in _regimes(name):
+            params = spec.parse(raw)
+            entry = {'dist': name, 'params': raw,
+                     'timing': benchmark(spec, params, sizes, repeat, seed)}
+            if quality_size:
+                entry['quality'] = quality(spec, params, quality_size, seed)
+            results.append(entry)
+            if log is not None:
+                best = max(r['samples_per_sec'] for r in entry['timing'])
+                q = entry.get('quality', {})
+                label = json.dumps(raw)
+                label = label if len(label) <= 32 else label[:29] + '...'
+                print(f'{name:12s} {label:32s} {best:10.3g} muestras/s  '
+                      f'KS p={q.get("ks_p", float("nan")):.3g}  χ² p={q.get("chi2_p", float("nan")):.3g}',
+                      file=log)
+    return {'meta': {'commit': _git_commit(), 'python': platform.python_version(),
+                     'numpy': np.__version__, 'platform': platform.platform(),
+                     'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'seed': seed, 'repeat': repeat},
+            'results': results}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Benchmark de rendimiento y calidad de los generadores.')
+    parser.add_argument('-o', '--output', default='benchmark_generators.json', help='archivo JSON de salida')
+    parser.add_argument('--max-size', type=lambda t: int(float(t)), default=SIZES[-1],
+                        help='tamaño máximo (acepta 1e8)')
+    parser.add_argument('--only', nargs='+', choices=list(DISTRIBUTION_REGISTRY), help='distribuciones a medir')
+    parser.add_argument('--repeat', type=int, default=3, help='repeticiones por tamaño (se toma la mejor)')
+    parser.add_argument('--quality-size', type=lambda t: int(float(t)), default=QUALITY_SIZE,
+                        help='muestras para KS/chi-cuadrado (0 desactiva)')
+    parser.add_argument('--seed', type=int, default=0)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = [s for s in SIZES if s <= args.max_size]
+    report = run(sizes, args.only, args.repeat, args.quality_size, args.seed, log=sys.stderr)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f'Resultados -> {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,11 @@
-import random
 import numpy as np
 
+from random_stream import as_generator
+
 class CovidSimulation:
     # States: 0=empty, 1=susceptible, 2=infected, 3=recovered, 4=dead
-    def __init__(self, rows=60, cols=60, init_infected=5, p_infect=0.3, p_recover=0.02, p_die=0.005):
+    def __init__(self, rows=60, cols=60, init_infected=5, p_infect=0.3, p_recover=0.02, p_die=0.005, rng=None):
+        self.rng = as_generator(rng)
         self.rows = rows
         self.cols = cols
         self.grid = np.ones((rows, cols), dtype=int)
@@ -12,12 +14,16 @@ class CovidSimulation:
         self.p_recover = p_recover
         self.p_die = p_die
         for _ in range(init_infected):
-            r = random.randrange(rows)
-            c = random.randrange(cols)
+            r = self.rng.integers(rows)
+            c = self.rng.integers(cols)
             self.grid[r, c] = 2
 
     def step(self):
         new = self.grid.copy()
+        # Se sortean de una vez los uniformes del paso para no depender de estado global
+        u_infect = self.rng.random((self.rows, self.cols))
+        u_die = self.rng.random((self.rows, self.cols))
+        u_recover = self.rng.random((self.rows, self.cols))
         for r in range(self.rows):
             for c in range(self.cols):
                 state = self.grid[r, c]
@@ -26,19 +32,23 @@ class CovidSimulation:
                     infected_neighbors = np.sum(neigh == 2)
                     if infected_neighbors > 0:
                         p = 1 - ((1 - self.p_infect) ** infected_neighbors)
-                        if random.random() < p:
+                        if u_infect[r, c] < p:
                             new[r, c] = 2
                 elif state == 2:
-                    if random.random() < self.p_die:
+                    if u_die[r, c] < self.p_die:
                         new[r, c] = 4
-                    elif random.random() < self.p_recover:
+                    elif u_recover[r, c] < self.p_recover:
                         new[r, c] = 3
         self.grid = new
         self.t += 1
 
+    def counts_array(self):
+        """Conteo por estado (0..4) como arreglo, apto para grabar historiales."""
+        return np.bincount(self.grid.ravel(), minlength=5)
+
     def counts(self):
         unique, counts = np.unique(self.grid, return_counts=True)
         d = {k:0 for k in range(5)}
         for u, c in zip(unique, counts):
             d[int(u)] = int(c)
-        return d
\ No newline at end of file
+        return d
@@ -0,0 +1,68 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+CYCLE_WINDOW = 1024
+
+
+class CycleDetector:
+    """Detecta estados repetidos de un autómata guardando el hash de las últimas
+    `window` generaciones.
+
+    `observe(state)` se llama con cada generación (empezando por la inicial); en cuanto
+    un estado repite a uno anterior quedan fijados `transient` (generación en que empieza
+    el ciclo) y `period` (1 para un punto fijo). Los ciclos más largos que `window` no
+    se detectan.
+    """
+
+    def __init__(self, window=CYCLE_WINDOW):
+        self.window = int(window)
+        if self.window <= 0:
+            raise ValueError('window debe ser > 0')
+        self.reset()
+
+    def reset(self):
+        self.generation = 0
+        self.transient = None
+        self.period = None
+        self._seen = OrderedDict()
+
+    @property
+    def found(self):
+        # Un estado repetido ya no cambiará: quien itera puede detenerse aquí
+        return self.period is not None
+
+    def describe(self):
+        """Texto corto del ciclo encontrado ('' mientras no haya ninguno)."""
+        if not self.found:
+            return ''
+        if self.period == 1:
+            return f'estable desde la gen. {self.transient}'
+        return f'ciclo de período {self.period} desde la gen. {self.transient}'
+
+    @staticmethod
+    def digest(state):
+        # Un bit por celda; el digest (y no los bytes) acota la memoria por generación
+        packed = np.packbits(np.asarray(state) != 0)
+        return hashlib.blake2b(packed.tobytes(), digest_size=16).digest()
+
+    def observe(self, state):
+        """Registra la siguiente generación; devuelve True si ya se encontró un ciclo."""
+        key = self.digest(state)
+        previous = self._seen.get(key)
+        if previous is not None and not self.found:
+            self.transient = previous
+            self.period = self.generation - previous
+        elif previous is None:
+            self._seen[key] = self.generation
+            if len(self._seen) > self.window:
+                self._seen.popitem(last=False)
+        self.generation += 1
+        return self.found
+
+
+def cycle_note(cycles):
+    """Sufijo para el título de una gráfica: ' — ' + describe(), o '' (también sin detector)."""
+    text = cycles.describe() if cycles is not None else ''
+    return f' — {text}' if text else ''
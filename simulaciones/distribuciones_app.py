@@ -1,22 +1,46 @@
 # distribuciones_app.py
 import tkinter as tk
-from tkinter import font, messagebox
+from tkinter import font, messagebox, ttk
+import functools
+import os
+import queue
+import threading
 import numpy as np
 import matplotlib
 matplotlib.use('TkAgg')
 from matplotlib.figure import Figure
+from matplotlib.patches import StepPatch
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-from random_generators import RandomGenerators
+from random_generators import RandomGenerators, DISTRIBUTION_REGISTRY, get_distribution
+from sample_cache import SampleCache
+from sample_stats import BinnedKDE, StreamingHistogram, binned_chi_square, binned_ks
 
 
 BG_COLOR = "#f0f5ff"
 PLOT_BG = "#e6eeff"
+SAMPLE_CHUNK = 2**20
+POLL_MS = 50
+CACHE_BYTES = 64 * 2**20
+CACHE_DISK_BYTES = 512 * 2**20
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'simulaciones')
+CURVE_POINTS = 512
 
 
 def plot_histogram(data, ax, bins=50, title='', xlabel='Valor'):
     ax.clear()
-    ax.hist(data, bins=bins, density=True, alpha=0.75, color="#4361ee")
+    if isinstance(data, StreamingHistogram):
+        # Conteos ya agrupados: un único artista (escalera rellena) sin importar bins ni n.
+        # Se agrega con add_artist y límites explícitos: ax.stairs/add_patch recorre cada
+        # vértice como curva de Bézier y con ~10^4 bins tarda casi un segundo
+        density, edges = data.density(), data.edges
+        patch = StepPatch(density, edges, fill=True, alpha=0.75, color="#4361ee")
+        patch.sticky_edges.y.append(0)
+        ax.add_artist(patch)
+        ax.update_datalim([(edges[0], 0), (edges[-1], density.max(initial=0))])
+        ax.autoscale_view()
+    else:
+        ax.hist(data, bins=bins, density=True, alpha=0.75, color="#4361ee")
     ax.set_title(title, fontsize=12)
     ax.set_xlabel(xlabel)
     ax.set_ylabel('Densidad')
@@ -24,6 +48,49 @@ def plot_histogram(data, ax, bins=50, title='', xlabel='Valor'):
     ax.set_facecolor(PLOT_BG)
 
 
+def _frozen(params):
+    return tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _theoretical_curve(dist, frozen_params, lo, hi):
+    # Depende sólo de (distribución, parámetros, rango): se evalúa una vez por histograma
+    spec = get_distribution(dist)
+    params = {k: list(v) if isinstance(v, tuple) else v for k, v in frozen_params}
+    if spec.discrete:
+        x = np.arange(np.ceil(lo), np.floor(hi))
+    else:
+        x = np.linspace(lo, hi, CURVE_POINTS)
+    return x, spec.pdf(x, params)
+
+
+def plot_kde(curve, ax):
+    """Dibuja la KDE precalculada (arreglo 2 x G con la grilla y la densidad)."""
+    ax.plot(curve[0], curve[1], color="#2a9d8f", linewidth=1.5, label='KDE')
+
+
+def plot_fit(hist, ax, dist, params):
+    """Superpone la densidad/pmf teórica y las pruebas KS y chi-cuadrado agrupadas."""
+    if hist.counts is None:
+        return
+    spec = get_distribution(dist)
+    edges = hist.edges
+    x, y = _theoretical_curve(dist, _frozen(params), float(edges[0]), float(edges[-1]))
+    if spec.discrete:
+        # Cada entero k ocupa el bin [k, k+1)
+        ax.plot(x + 0.5, y, 'o', color="#e63946", markersize=4, label='pmf teórica')
+    else:
+        ax.plot(x, y, color="#e63946", linewidth=1.5, label='densidad teórica')
+    cdf = functools.partial(spec.cdf, params=params)
+    d, p_ks = binned_ks(hist, cdf)
+    chi2, dof, p_chi2 = binned_chi_square(hist, cdf)
+    ax.text(0.98, 0.97, f'KS D = {d:.4f} (p = {p_ks:.3g})\n'
+                        f'χ² = {chi2:.1f}, gl = {dof} (p = {p_chi2:.3g})',
+            transform=ax.transAxes, ha='right', va='top', fontsize=9,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    ax.legend(loc='upper left', fontsize=9)
+
+
 class DistribucionesApp:
     def __init__(self, root):
         self.root = root
@@ -44,7 +111,7 @@ class DistribucionesApp:
         tk.Label(left, text="Distribución:", bg="white", fg="#495057",
                  font=self.base_font, anchor="w").pack(fill='x', padx=20, pady=(10, 2))
         self.dist_var = tk.StringVar(value='normal')
-        dists = ['uniform','exponential','erlang','gamma','normal','weibull','bernoulli','binomial','poisson']
+        dists = list(DISTRIBUTION_REGISTRY)
         self.dist_combo = tk.OptionMenu(left, self.dist_var, *dists)
         self.dist_combo.config(font=self.base_font, bg="white", width=18, anchor="w")
         self.dist_combo.pack(fill='x', padx=20, pady=(0, 15))
@@ -59,7 +126,22 @@ class DistribucionesApp:
                  font=self.base_font, anchor="w").pack(fill='x', padx=20, pady=(10, 2))
         self.params_entry = tk.Entry(left, font=self.base_font, relief="solid", bd=1)
         self.params_entry.insert(0, 'mu=0,sigma=1')
-        self.params_entry.pack(fill='x', padx=20, pady=(0, 20))
+        self.params_entry.pack(fill='x', padx=20, pady=(0, 15))
+
+        tk.Label(left, text="Semilla (opcional, habilita caché):", bg="white", fg="#495057",
+                 font=self.base_font, anchor="w").pack(fill='x', padx=20, pady=(10, 2))
+        self.seed_entry = tk.Entry(left, font=self.base_font, relief="solid", bd=1)
+        self.seed_entry.pack(fill='x', padx=20, pady=(0, 10))
+
+        self.disk_cache_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left, text="Guardar caché en disco", variable=self.disk_cache_var,
+                       command=self._toggle_disk_cache, bg="white", fg="#495057",
+                       font=self.base_font, anchor="w").pack(fill='x', padx=20, pady=(0, 4))
+
+        self.kde_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(left, text="Superponer KDE (continuas)", variable=self.kde_var,
+                       bg="white", fg="#495057", font=self.base_font,
+                       anchor="w").pack(fill='x', padx=20, pady=(0, 10))
 
         self.btn = tk.Button(left, text="Generar y graficar", command=self._generate_and_plot,
                              bg="#4361ee", fg="white", font=self.base_font,
@@ -68,6 +150,19 @@ class DistribucionesApp:
         self.btn.bind("<Enter>", lambda e: self.btn.config(bg="#3a56e4"))
         self.btn.bind("<Leave>", lambda e: self.btn.config(bg="#4361ee"))
 
+        self.progress = ttk.Progressbar(left, mode='determinate', maximum=100)
+        self.progress.pack(fill='x', padx=20, pady=(10, 4))
+        self.cancel_btn = tk.Button(left, text="Cancelar", command=self._cancel,
+                                    bg="#e63946", fg="white", font=self.base_font,
+                                    relief="flat", cursor="hand2", state='disabled')
+        self.cancel_btn.pack(fill='x', padx=20, pady=4)
+
+        self._queue = queue.Queue()
+        self._cancel_event = None
+        self._worker = None
+        # El nivel en disco (~/.cache/simulaciones) sólo se usa si se activa la casilla
+        self.cache = SampleCache(CACHE_BYTES, disk_max_bytes=CACHE_DISK_BYTES)
+
         right = tk.Frame(root, bg=BG_COLOR)
         right.pack(side='right', fill='both', expand=True, padx=(0,15), pady=15)
 
@@ -94,58 +189,104 @@ class DistribucionesApp:
                         d[k.strip()] = v
         return d
 
+    def _sample(self, dist, params, n, seed, cancel, out_queue, kde=None):
+        """Hilo de trabajo: muestrea en bloques y publica instantáneas del histograma.
+
+        Con `kde` cada instantánea lleva además la curva ya evaluada (la FFT también
+        corre aquí, fuera del hilo de la UI).
+        """
+        done = 0
+        try:
+            hist = StreamingHistogram(bins=get_distribution(dist).bins)
+            for block in RandomGenerators.stream(dist, params, total=n, chunk=SAMPLE_CHUNK, rng=seed):
+                if cancel.is_set():
+                    out_queue.put(('cancelled', done, None))
+                    return
+                hist.update(block)
+                if kde is not None:
+                    kde.update(block)
+                done += block.size
+                curve = None if kde is None else np.vstack(kde.evaluate())
+                out_queue.put(('progress', done, (hist.copy(), curve)))
+            out_queue.put(('done', done, (hist.copy(), curve)))
+        except Exception as e:
+            out_queue.put(('error', done, e))
+
+    def _start_sampling(self, dist, params, n, title, seed=None, kde=False):
+        # Sin semilla cada corrida es distinta, así que sólo se cachea con semilla fija
+        kde = kde and not get_distribution(dist).discrete
+        key = None if seed is None else SampleCache.key(dist, params, n, seed)
+        kde_key = None if key is None or not kde else key + ('kde',)
+        cached = None if key is None else self.cache.get(key)
+        curve = None if kde_key is None else self.cache.get(kde_key)
+        if cached is not None and (curve is not None or not kde):
+            self.progress['value'] = 100
+            self._draw(cached, curve, title, dist, params)
+            return
+        self._cancel_event = threading.Event()
+        self._queue = queue.Queue()
+        self._job = (n, title, key, kde_key, dist, params)
+        self.progress['value'] = 0
+        self.btn.config(state='disabled')
+        self.cancel_btn.config(state='normal')
+        self._worker = threading.Thread(target=self._sample, daemon=True,
+                                        args=(dist, params, n, seed, self._cancel_event, self._queue,
+                                              BinnedKDE() if kde else None))
+        self._worker.start()
+        self.root.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        # Tk no es seguro entre hilos: sólo este callback del bucle principal toca la UI
+        n, title, key, kde_key, dist, params = self._job
+        latest, finished = None, False
+        while True:
+            try:
+                kind, done, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self.progress['value'] = 100.0 * done / n
+            if kind in ('progress', 'done'):
+                latest = payload
+            if kind == 'done' and key is not None:
+                self.cache.put(key, payload[0])
+                if kde_key is not None:
+                    self.cache.put(kde_key, payload[1])
+            if kind == 'error':
+                messagebox.showerror('Error', f'Error generando la distribución:\n{payload}')
+            finished = finished or kind in ('done', 'cancelled', 'error')
+        if latest is not None:
+            self._draw(latest[0], latest[1], title, dist, params)
+        if finished:
+            self.btn.config(state='normal')
+            self.cancel_btn.config(state='disabled')
+        else:
+            self.root.after(POLL_MS, self._poll)
+
+    def _draw(self, hist, curve, title, dist, params):
+        plot_histogram(hist, self.ax, title=title)
+        if curve is not None:
+            plot_kde(curve, self.ax)
+        plot_fit(hist, self.ax, dist, params)
+        self.canvas.draw_idle()
+
+    def _toggle_disk_cache(self):
+        self.cache.set_disk_dir(CACHE_DIR if self.disk_cache_var.get() else None)
+
+    def _cancel(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
     def _generate_and_plot(self):
         dist = self.dist_var.get()
         n = max(1, int(self.dist_size.get()))
         params = self._parse_params(self.params_entry.get())
+        seed_text = self.seed_entry.get().strip()
         try:
-            if dist == 'uniform':
-                a = params.get('a', 0.0)
-                b = params.get('b', 1.0)
-                data = RandomGenerators.uniform(a=a, b=b, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Uniforme U({a}, {b})')
-            elif dist == 'exponential':
-                lam = params.get('lam', params.get('lambda', 1.0))
-                data = RandomGenerators.exponential(lam=lam, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Exponencial (λ = {lam})')
-            elif dist == 'erlang':
-                k = int(params.get('k', 2))
-                lam = params.get('lam', 1.0)
-                data = RandomGenerators.erlang(k=k, lam=lam, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Erlang (k = {k}, λ = {lam})')
-            elif dist == 'gamma':
-                shape = params.get('shape', 2.0)
-                scale = params.get('scale', 1.0)
-                data = RandomGenerators.gamma(shape=shape, scale=scale, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Gamma (shape = {shape}, scale = {scale})')
-            elif dist == 'normal':
-                mu = params.get('mu', 0.0)
-                sigma = params.get('sigma', 1.0)
-                data = RandomGenerators.normal(mu=mu, sigma=sigma, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Normal N({mu}, {sigma**2})')
-            elif dist == 'weibull':
-                k = params.get('k', 1.5)
-                lam = params.get('lam', 1.0)
-                data = RandomGenerators.weibull(k=k, lam=lam, size=n)
-                plot_histogram(data, self.ax, bins=50, title=f'Weibull (k = {k}, λ = {lam})')
-            elif dist == 'bernoulli':
-                p = params.get('p', 0.5)
-                data = RandomGenerators.bernoulli(p=p, size=n)
-                plot_histogram(data, self.ax, bins=2, title=f'Bernoulli (p = {p})')
-            elif dist == 'binomial':
-                nn = int(params.get('n', 10))
-                p = params.get('p', 0.5)
-                data = RandomGenerators.binomial(n=nn, p=p, size=n)
-                plot_histogram(data, self.ax, bins=range(0, nn+2), title=f'Binomial (n = {nn}, p = {p})')
-            elif dist == 'poisson':
-                lam = params.get('lam', 1.0)
-                data = RandomGenerators.poisson(lam=lam, size=n)
-                bins = range(0, int(max(data)) + 2) if len(data) > 0 else 2
-                plot_histogram(data, self.ax, bins=bins, title=f'Poisson (λ = {lam})')
-            else:
-                raise ValueError('Distribución no soportada')
-
-            self.canvas.draw()
+            spec = get_distribution(dist)
+            sample_params = spec.parse(params)
+            title = spec.title(sample_params)
+            seed = int(seed_text) if seed_text else None
+            self._start_sampling(dist, sample_params, n, title, seed, kde=self.kde_var.get())
         except Exception as e:
             messagebox.showerror('Error', f'Error generando la distribución:\n{e}')
 
@@ -153,4 +294,4 @@ class DistribucionesApp:
 def main():
     root = tk.Tk()
     app = DistribucionesApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
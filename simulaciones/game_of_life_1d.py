@@ -1,30 +1,330 @@
 import numpy as np
 
+from cycle_detector import CYCLE_WINDOW, CycleDetector
+
+SPACETIME_ROWS = 200  # generaciones visibles en un diagrama espacio-tiempo
+
 class GameOfLife1D:
     def __init__(self, length=200, rule=30):
         self.length = length
         self.rule = rule
         self.rule_map = self._rule_to_map(rule)
+        self.rule_table = self._rule_to_table(rule)
         self.state = np.zeros(length, dtype=int)
         self.state[length // 2] = 1
+        self.cycles = None
+        self._buffers()
 
     def _rule_to_map(self, rule):
         bits = [(rule >> i) & 1 for i in range(8)]
         triplets = [(1,1,1),(1,1,0),(1,0,1),(1,0,0),(0,1,1),(0,1,0),(0,0,1),(0,0,0)]
         return {triplets[i]: bits[7-i] for i in range(8)}
 
+    def _rule_to_table(self, rule):
+        # rule_table[4*L + 2*C + R] es el nuevo estado de la celda central
+        return (rule >> np.arange(8)) & 1
+
+    def _buffers(self):
+        # Buffers reutilizados en cada paso: el estado siguiente y el índice de vecindad
+        self._next = np.empty_like(self.state)
+        self._index = np.empty(self.state.shape, dtype=np.intp)
+
+    def _neighbourhood(self, s):
+        idx = self._index
+        # idx = 4*L + 2*C + R con borde periódico, sin temporales
+        idx[1:] = s[:-1]
+        idx[0] = s[-1]
+        idx <<= 1
+        idx += s
+        idx <<= 1
+        idx[:-1] += s[1:]
+        idx[-1] += s[0]
+        return idx
+
     def step(self):
-        new = np.zeros_like(self.state)
-        for i in range(self.length):
-            left = self.state[(i-1) % self.length]
-            center = self.state[i]
-            right = self.state[(i+1) % self.length]
-            new[i] = self.rule_map[(left, center, right)]
-        self.state = new
+        s = self.state
+        if self._next.shape != s.shape or self._next.dtype != s.dtype:
+            self._buffers()
+        np.take(self.rule_table, self._neighbourhood(s), out=self._next)
+        self.state, self._next = self._next, s
+        if self.cycles is not None:
+            self.cycles.observe(self.state)
+
+    def track_cycles(self, window=CYCLE_WINDOW):
+        """Empieza a registrar el hash de cada generación, desde el estado actual."""
+        self.cycles = CycleDetector(window)
+        self.cycles.observe(self.state)
+        return self.cycles
+
+    def run(self, generations, out=None):
+        """Avanza `generations` pasos y guarda cada nuevo estado como una fila de `out`.
+
+        `out` puede ser un arreglo (o memmap) de forma (generations, length), de cualquier
+        dtype entero, o un SpacetimeRing; sin `out` se crea el arreglo. El estado actual
+        no se incluye: para un diagrama completo, `out[0] = ca.state; ca.run(n - 1, out[1:])`.
+        """
+        generations = int(generations)
+        if isinstance(out, SpacetimeRing):
+            for _ in range(generations):
+                self.step()
+                out.push(self.state)
+            return out
+        if out is None:
+            out = np.empty((generations, self.length), dtype=self.state.dtype)
+        elif out.shape != (generations, self.length):
+            raise ValueError(f'out debe tener forma {(generations, self.length)}')
+        if generations == 0:
+            return out
+        if self._next.shape != self.state.shape:
+            self._buffers()
+        # Cada generación se escribe directo en su fila; la fila anterior es la entrada
+        table = self.rule_table.astype(out.dtype, copy=False)
+        prev = self.state
+        for row in out:
+            np.take(table, self._neighbourhood(prev), out=row)
+            prev = row
+            if self.cycles is not None:
+                self.cycles.observe(row)
+        self.state[...] = prev
+        return out
 
     def reset(self, seed=None):
         self.state = np.zeros(self.length, dtype=int)
         if seed is None:
             self.state[self.length // 2] = 1
         else:
-            self.state = np.array(seed, dtype=int)
\ No newline at end of file
+            self.state = np.array(seed, dtype=int)
+            self.length = self.state.size
+        self._buffers()
+        if self.cycles is not None:
+            self.track_cycles(self.cycles.window)
+
+
+class SpacetimeRing:
+    """Ventana circular de las últimas `rows` generaciones de un autómata 1D.
+
+    Cada fila se escribe dos veces (en `head` y en `head + rows`) sobre un buffer de
+    2*rows filas, así `view()` devuelve siempre una vista contigua en orden cronológico
+    sin copiar.
+    """
+
+    def __init__(self, rows, length, dtype=np.uint8):
+        self.rows = int(rows)
+        self.buffer = np.zeros((2 * self.rows, int(length)), dtype=dtype)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, row):
+        self.buffer[self.head] = row
+        self.buffer[self.head + self.rows] = row
+        self.head = (self.head + 1) % self.rows
+        self.count = min(self.count + 1, self.rows)
+
+    def view(self):
+        end = self.head + self.rows
+        return self.buffer[end - self.count:end]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+
+_WORD = np.dtype('<u8')
+_ONE = np.uint64(1)
+
+
+class PackedGameOfLife1D:
+    """Autómata elemental con 64 celdas por palabra uint64 (la celda i es el bit i % 64
+    de la palabra i // 64), para cintas de 10^8 celdas.
+
+    Cada paso evalúa la regla como OR de mintérminos sobre las palabras desplazadas
+    L, C, R; los bits que cruzan palabras y el borde periódico se arrastran a mano.
+    """
+
+    def __init__(self, length=200, rule=30):
+        cells = np.zeros(length, dtype=np.uint8)
+        cells[length // 2] = 1
+        self.rule = rule
+        self._load(cells)
+
+    @classmethod
+    def from_cells(cls, cells, rule=30):
+        ca = cls.__new__(cls)
+        ca.rule = rule
+        ca._load(np.asarray(cells))
+        return ca
+
+    def to_cells(self):
+        return np.unpackbits(self.words.view(np.uint8), count=self.length, bitorder='little')
+
+    @property
+    def state(self):
+        return self.to_cells()
+
+    def reset(self, seed=None):
+        if seed is None:
+            cells = np.zeros(self.length, dtype=np.uint8)
+            cells[self.length // 2] = 1
+        else:
+            cells = np.asarray(seed)
+        self._load(cells)
+
+    def _load(self, cells):
+        self.length = int(cells.size)
+        if self.length == 0:
+            raise ValueError('La cinta debe tener al menos una celda')
+        nwords = -(-self.length // 64)
+        packed = np.zeros(nwords * 8, dtype=np.uint8)
+        packed[:-(-self.length // 8)] = np.packbits(cells.ravel() != 0, bitorder='little')
+        self.words = packed.view(_WORD)
+        self._tail = np.uint64((self.length - 1) % 64)
+        tail_bits = self.length - 64 * (nwords - 1)
+        self._mask = np.uint64(2 ** tail_bits - 1)
+        self._next, self._left, self._right, self._tmp = (np.empty_like(self.words) for _ in range(4))
+        self._inverse = {name: np.empty_like(self.words) for name in 'LCR'}
+        self._inverted = set()
+
+    def step(self):
+        w, left, right, tmp = self.words, self._left, self._right, self._tmp
+        first = w[0] & _ONE
+        last = (w[-1] >> self._tail) & _ONE
+        # L: vecino izquierdo de cada bit; el bit 0 trae el bit 63 de la palabra anterior
+        np.left_shift(w, _ONE, out=left)
+        np.right_shift(w[:-1], np.uint64(63), out=tmp[1:])
+        left[1:] |= tmp[1:]
+        left[0] |= last
+        # R: vecino derecho; el último bit válido recibe la celda 0 (borde periódico)
+        np.right_shift(w, _ONE, out=right)
+        np.left_shift(w[1:], np.uint64(63), out=tmp[:-1])
+        right[:-1] |= tmp[:-1]
+        right[-1] |= first << self._tail
+        self._inverted.clear()
+        new = self._next
+        new.fill(0)
+        for lbit in (0, 1):
+            for rbit in (0, 1):
+                on_center = (self.rule >> (4 * lbit + 2 + rbit)) & 1
+                off_center = (self.rule >> (4 * lbit + rbit)) & 1
+                if not (on_center or off_center):
+                    continue
+                np.bitwise_and(left if lbit else self._not(left, 'L'),
+                               right if rbit else self._not(right, 'R'), out=tmp)
+                if on_center and not off_center:
+                    tmp &= w
+                elif off_center and not on_center:
+                    tmp &= self._not(w, 'C')
+                new |= tmp
+        new[-1] &= self._mask
+        self.words, self._next = new, w
+
+    def _not(self, words, name):
+        # ~L, ~C y ~R se calculan a lo sumo una vez por paso
+        buf = self._inverse[name]
+        if name not in self._inverted:
+            np.invert(words, out=buf)
+            self._inverted.add(name)
+        return buf
+
+
+class ElementaryRuleSweep:
+    """Evoluciona muchas reglas elementales a la vez desde el mismo estado inicial.
+
+    El estado es una matriz (reglas, length) y cada fila usa su propia tabla de 8
+    entradas; un paso es un único `np.take` sobre las tablas concatenadas.
+    """
+
+    def __init__(self, length=200, rules=range(256), seed=None):
+        self.rules = np.array(list(rules), dtype=np.int64)
+        if self.rules.size == 0 or self.rules.min() < 0 or self.rules.max() > 255:
+            raise ValueError('Las reglas deben estar entre 0 y 255')
+        self.length = int(length)
+        self.tables = ((self.rules[:, np.newaxis] >> np.arange(8)) & 1).astype(np.uint8)
+        # Desplazamiento de la tabla de cada fila dentro de tables.ravel()
+        # Índices de 16 bits cuando alcanzan: la mitad de tráfico de memoria por paso
+        self._index_dtype = np.uint16 if 8 * self.rules.size <= 2**16 else np.intp
+        self._offsets = 8 * np.arange(self.rules.size, dtype=self._index_dtype)[:, np.newaxis]
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        if seed is None:
+            cells = np.zeros(self.length, dtype=np.uint8)
+            cells[self.length // 2] = 1
+        else:
+            cells = np.asarray(seed, dtype=np.uint8)
+            self.length = cells.size
+        shape = (self.rules.size, self.length)
+        self.state = np.empty(shape, dtype=np.uint8)
+        self.state[...] = cells
+        self._next = np.empty(shape, dtype=np.uint8)
+        self._index = np.empty(shape, dtype=self._index_dtype)
+
+    def _neighbourhood(self):
+        s, idx = self.state, self._index
+        idx[:, 1:] = s[:, :-1]
+        idx[:, 0] = s[:, -1]
+        idx <<= 1
+        idx += s
+        idx <<= 1
+        idx[:, :-1] += s[:, 1:]
+        idx[:, -1] += s[:, 0]
+        idx += self._offsets
+        return idx
+
+    def _advance(self, idx):
+        np.take(self.tables.ravel(), idx, out=self._next)
+        self.state, self._next = self._next, self.state
+
+    def step(self):
+        self._advance(self._neighbourhood())
+
+    def _packed_rows(self):
+        # Un bit por celda y cada fila vista como un bytes de ancho fijo: comparación exacta
+        packed = np.packbits(self.state, axis=1)
+        return packed.view(f'S{packed.shape[1]}').ravel()
+
+    def run(self, generations):
+        """Avanza `generations` pasos y devuelve estadísticas por generación y regla.
+
+        Devuelve un dict con `density` y `entropy` de forma (generations + 1, reglas)
+        (entropía de Shannon, en bits, de las vecindades de 3 celdas) y, por regla,
+        `transient` y `period` del primer ciclo encontrado (-1 y 0 si no se repitió).
+        """
+        steps = int(generations) + 1
+        nrules = self.rules.size
+        density = np.empty((steps, nrules))
+        entropy = np.empty((steps, nrules))
+        rows = np.empty((steps, nrules), dtype=f'S{(self.length + 7) // 8}')
+        for t in range(steps):
+            idx = self._neighbourhood()
+            counts = np.bincount(idx.ravel(), minlength=8 * nrules).reshape(nrules, 8)
+            p = counts / self.length
+            with np.errstate(divide='ignore', invalid='ignore'):
+                entropy[t] = np.sum(np.where(p > 0, -p * np.log2(p), 0.0), axis=1)
+            # Las vecindades con centro vivo (bit 1) cuentan cada celda viva una vez
+            density[t] = counts[:, 2::4].sum(axis=1) + counts[:, 3::4].sum(axis=1)
+            rows[t] = self._packed_rows()
+            if t < steps - 1:
+                self._advance(idx)
+        density /= self.length
+        transient, period = _first_repeat(rows)
+        return {'rules': self.rules, 'density': density, 'entropy': entropy,
+                'transient': transient, 'period': period}
+
+
+def _first_repeat(keys):
+    """Para cada columna, primer t con keys[t] == keys[s], s < t: devuelve (s, t - s)."""
+    steps = keys.shape[0]
+    order = np.argsort(keys, axis=0, kind='stable')
+    ordered = np.take_along_axis(keys, order, axis=0)
+    # En cada par igual y adyacente del orden estable, order[j + 1] es la repetición posterior
+    later = np.where(ordered[1:] == ordered[:-1], order[1:], steps)
+    j = np.argmin(later, axis=0)
+    cols = np.arange(keys.shape[1])
+    first = later[j, cols]
+    found = first < steps
+    transient = np.where(found, order[j, cols], -1)
+    period = np.where(found, first - order[j, cols], 0)
+    return transient, period
@@ -1,13 +1,26 @@
 import numpy as np
 
+from cycle_detector import CYCLE_WINDOW, CycleDetector
+from random_stream import as_generator
+
 class GameOfLife2D:
-    def __init__(self, rows=50, cols=50):
+    def __init__(self, rows=50, cols=50, rng=None):
+        self.rng = as_generator(rng)
         self.rows = rows
         self.cols = cols
         self.grid = np.zeros((rows, cols), dtype=int)
+        self.cycles = None
 
     def randomize(self, p=0.2):
-        self.grid = (np.random.random((self.rows, self.cols)) < p).astype(int)
+        self.grid = (self.rng.random((self.rows, self.cols)) < p).astype(int)
+        if self.cycles is not None:
+            self.track_cycles(self.cycles.window)
+
+    def track_cycles(self, window=CYCLE_WINDOW):
+        """Empieza a registrar el hash de cada generación, desde la grilla actual."""
+        self.cycles = CycleDetector(window)
+        self.cycles.observe(self.grid)
+        return self.cycles
 
     def step(self):
         new = np.zeros_like(self.grid)
@@ -20,4 +33,6 @@ class GameOfLife2D:
                 else:
                     if total == 3:
                         new[r, c] = 1
-        self.grid = new
\ No newline at end of file
+        self.grid = new
+        if self.cycles is not None:
+            self.cycles.observe(self.grid)
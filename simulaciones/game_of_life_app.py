@@ -10,7 +10,8 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from game_of_life_2d import GameOfLife2D
-from game_of_life_1d import GameOfLife1D
+from game_of_life_1d import SPACETIME_ROWS, GameOfLife1D, SpacetimeRing
+from cycle_detector import cycle_note
 
 
 BG_COLOR = "#f0f5ff"
@@ -110,12 +111,13 @@ class GameOfLifeApp:
         p = float(self.g2_p.get())
         self.g2 = GameOfLife2D(rows, cols)
         self.g2.randomize(p)
+        self.g2.track_cycles()
         self._g2_draw()
 
     def _g2_draw(self):
         self.g2_ax.clear()
         self.g2_ax.imshow(self.g2.grid, interpolation='nearest', cmap='gray_r')
-        self.g2_ax.set_title('Juego de la Vida 2D', fontsize=12, pad=10)
+        self.g2_ax.set_title('Juego de la Vida 2D' + cycle_note(self.g2.cycles), fontsize=12, pad=10)
         self.g2_ax.axis('off')
         self.g2_canvas.draw()
 
@@ -138,11 +140,14 @@ class GameOfLifeApp:
                     self._g2_step()
                 except:
                     self.g2_running = False
+                if self.g2.cycles is not None and self.g2.cycles.found:
+                    self.g2_running = False
         threading.Thread(target=loop, daemon=True).start()
 
     def _g2_clear(self):
         if self.g2 is not None:
             self.g2.grid = np.zeros_like(self.g2.grid)
+            self.g2.track_cycles()
             self._g2_draw()
 
     def _build_1d_tab(self):
@@ -172,31 +177,30 @@ class GameOfLifeApp:
         self.g1_canvas.get_tk_widget().pack(fill='both', expand=True, padx=5, pady=5)
 
         self.g1 = None
-        self.g1_hist = []
+        self.g1_hist = None
 
     def _g1_create(self):
         length = max(10, int(self.g1_len.get()))
         rule = max(0, min(255, int(self.g1_rule.get())))
         self.g1 = GameOfLife1D(length, rule)
         self.g1.reset()
-        self.g1_hist = [self.g1.state.copy()]
+        self.g1.track_cycles()
+        self.g1_hist = SpacetimeRing(SPACETIME_ROWS, length)
+        self.g1_hist.push(self.g1.state)
         self._g1_draw()
 
     def _g1_step(self):
         if self.g1 is None:
             self._g1_create()
-        self.g1.step()
-        self.g1_hist.append(self.g1.state.copy())
-        if len(self.g1_hist) > 200:
-            self.g1_hist.pop(0)
+        self.g1.run(1, out=self.g1_hist)
         self._g1_draw()
 
     def _g1_draw(self):
         self.g1_ax.clear()
         if self.g1_hist:
-            img = np.array(self.g1_hist)
+            img = self.g1_hist.view()
             self.g1_ax.imshow(img, aspect='auto', interpolation='nearest', cmap='gray_r')
-        self.g1_ax.set_title(f'Autómata 1D - Regla {self.g1.rule}', fontsize=12)
+        self.g1_ax.set_title(f'Autómata 1D - Regla {self.g1.rule}' + cycle_note(self.g1.cycles), fontsize=12)
         self.g1_ax.axis('off')
         self.g1_canvas.draw()
 
@@ -205,6 +209,8 @@ class GameOfLifeApp:
             for _ in range(200):
                 time.sleep(0.03)
                 self._g1_step()
+                if self.g1.cycles.found:
+                    break
         threading.Thread(target=run, daemon=True).start()
 
 
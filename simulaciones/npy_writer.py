@@ -0,0 +1,87 @@
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from random_generators import get_distribution
+from random_stream import as_generator
+
+
+class NpyWriter:
+    """Salida .npy respaldada por memmap que se llena bloque a bloque a lo largo del eje 0.
+
+    `reserve(n)` devuelve la vista de las siguientes n filas para que un sampler (out=)
+    o una simulación escriba en ella directamente; `write(block)` copia un bloque ya hecho.
+    """
+
+    def __init__(self, path, shape, dtype=np.float64):
+        shape = (int(shape),) if np.ndim(shape) == 0 else tuple(int(s) for s in shape)
+        self.path = path
+        self.array = open_memmap(path, mode='w+', dtype=np.dtype(dtype), shape=shape)
+        self.pos = 0
+
+    @property
+    def rows(self):
+        return self.array.shape[0]
+
+    @property
+    def remaining(self):
+        return self.rows - self.pos
+
+    def reserve(self, n):
+        n = int(n)
+        if n > self.remaining:
+            raise ValueError(f'Sólo quedan {self.remaining} filas libres en {self.path}')
+        view = self.array[self.pos:self.pos + n]
+        self.pos += n
+        return view
+
+    def write(self, block):
+        block = np.asarray(block)
+        if block.ndim == self.array.ndim - 1:
+            block = block[np.newaxis]
+        self.reserve(block.shape[0])[...] = block
+        return self
+
+    def flush(self):
+        self.array.flush()
+
+    def close(self):
+        if self.array is not None:
+            self.flush()
+            self.array = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_npy(path, mode='r'):
+    """Reabre un .npy sin leerlo a memoria (las páginas se cargan bajo demanda)."""
+    return np.load(path, mmap_mode=mode)
+
+
+def sample_to_npy(dist, params, total, path, chunk=2**20, rng=None, dtype=None):
+    """Muestrea `total` valores directamente sobre el memmap de `path`, bloque a bloque."""
+    spec = get_distribution(dist)
+    params = dict(params or {})
+    gen = as_generator(rng)
+    with NpyWriter(path, total, dtype or spec.dtype) as writer:
+        while writer.remaining:
+            spec.sample(rng=gen, out=writer.reserve(min(chunk, writer.remaining)), **params)
+    return open_npy(path)
+
+
+def record_simulation(step, snapshot, steps, path, dtype=None):
+    """Guarda snapshot() inicial y tras cada uno de `steps` llamados a step() en un .npy.
+
+    Sirve para cualquier simulación, p. ej. `record_simulation(sim.step, sim.counts_array, ...)`
+    o `record_simulation(ca.step, lambda: ca.state, ...)`.
+    """
+    first = np.asarray(snapshot())
+    with NpyWriter(path, (int(steps) + 1,) + first.shape, dtype or first.dtype) as writer:
+        writer.write(first)
+        for _ in range(int(steps)):
+            step()
+            writer.write(snapshot())
+    return open_npy(path)
@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from random_generators import get_distribution
+from random_stream import RandomStream, as_generator
+
+
+def _partition(size, workers):
+    return [(size * i // workers, size * (i + 1) // workers) for i in range(workers)]
+
+
+def _fill_slice(shm_name, dtype, size, start, stop, dist, params, stream, chunk):
+    # Se ejecuta en el proceso hijo: escribe su tramo directamente en la memoria compartida
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+        spec = get_distribution(dist)
+        gen = as_generator(stream)
+        for pos in range(start, stop, chunk):
+            spec.sample(rng=gen, out=out[pos:min(pos + chunk, stop)], **params)
+        del out
+    finally:
+        shm.close()
+    return stop - start
+
+
+class ParallelSampler:
+    """Muestreo en paralelo sobre un pool de procesos con un flujo independiente por worker.
+
+    Para una misma semilla, número de workers y chunk el resultado es idéntico bit a bit.
+    Los arreglos devueltos por `sample` viven en memoria compartida y son válidos
+    hasta `discard()`, `close()` o el fin del bloque `with`.
+    """
+
+    def __init__(self, workers=None, seed=None, bit_generator='pcg64', chunk=2**20):
+        self.workers = int(workers or os.cpu_count() or 1)
+        if self.workers <= 0:
+            raise ValueError('workers debe ser > 0')
+        self.stream = RandomStream(seed, bit_generator)
+        self.chunk = int(chunk)
+        self._pool = ProcessPoolExecutor(self.workers)
+        self._segments = []
+
+    def sample(self, dist, params=None, size=1):
+        dtype = get_distribution(dist).dtype
+        size = int(size)
+        params = dict(params or {})
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size * dtype.itemsize))
+        self._segments.append(shm)
+        # Cada llamada consume un nuevo conjunto de flujos hijos: llamadas sucesivas no se solapan
+        streams = self.stream.spawn(self.workers)
+        futures = [self._pool.submit(_fill_slice, shm.name, dtype, size, start, stop,
+                                     dist, params, stream, self.chunk)
+                   for (start, stop), stream in zip(_partition(size, self.workers), streams)]
+        for f in futures:
+            f.result()
+        return np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+
+    def discard(self):
+        """Libera los segmentos de memoria compartida de las muestras ya devueltas."""
+        for shm in self._segments:
+            try:
+                shm.close()
+            except BufferError:
+                # Aún hay vistas vivas sobre el segmento; se libera el nombre igualmente
+                pass
+            shm.unlink()
+        self._segments = []
+
+    def close(self):
+        self._pool.shutdown()
+        self.discard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parallel_sample(dist, params=None, size=1, workers=None, seed=None, bit_generator='pcg64', chunk=2**20):
+    """Atajo que devuelve una copia en memoria privada del resultado."""
+    with ParallelSampler(workers, seed, bit_generator, chunk) as sampler:
+        return sampler.sample(dist, params, size).copy()
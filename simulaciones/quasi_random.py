@@ -0,0 +1,199 @@
+import numpy as np
+
+from random_stream import as_generator
+
+
+# Números de dirección de Joe-Kuo (dimensiones 2..16): (grado s, coeficientes a, m_1..m_s)
+_SOBOL_DIRECTIONS = [
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+]
+
+_SOBOL_BITS = 32
+
+
+def _sobol_direction_numbers(dim):
+    """Devuelve V[dim, bits] con V[j, k] = m_k << (bits - k - 1)."""
+    v = np.zeros((dim, _SOBOL_BITS), dtype=np.uint64)
+    v[0] = [1 << (_SOBOL_BITS - k - 1) for k in range(_SOBOL_BITS)]
+    for j in range(1, dim):
+        s, a, m_init = _SOBOL_DIRECTIONS[j - 1]
+        m = list(m_init)
+        for k in range(s, _SOBOL_BITS):
+            new = m[k - s] ^ (m[k - s] << s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    new ^= m[k - i] << i
+            m.append(new)
+        v[j] = [m[k] << (_SOBOL_BITS - k - 1) for k in range(_SOBOL_BITS)]
+    return v
+
+
+def _primes(n):
+    out = []
+    c = 2
+    while len(out) < n:
+        if all(c % p for p in out if p * p <= c):
+            out.append(c)
+        c += 1
+    return out
+
+
+class QuasiRandomSource:
+    """Fuente de uniformes de baja discrepancia con la misma firma que Generator.random.
+
+    `random(n)` devuelve la primera coordenada de los siguientes n puntos;
+    `random((n, d))` devuelve los n puntos completos en d dimensiones.
+    """
+
+    max_dim = None
+
+    def __init__(self):
+        self.index = 0
+
+    def reset(self):
+        self.index = 0
+
+    def _coordinate(self, j, idx):
+        raise NotImplementedError
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        if out is not None:
+            shape = out.shape
+        elif size is None:
+            shape = ()
+        else:
+            shape = (size,) if np.ndim(size) == 0 else tuple(size)
+        n = int(shape[0]) if shape else 1
+        dim = int(shape[1]) if len(shape) > 1 else 1
+        if len(shape) > 2:
+            raise ValueError('size debe ser n o (n, d)')
+        if self.max_dim is not None and dim > self.max_dim:
+            raise ValueError(f'{type(self).__name__} admite hasta {self.max_dim} dimensiones')
+        idx = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        pts = out.reshape(n, dim)
+        for j in range(dim):
+            pts[:, j] = self._coordinate(j, idx)
+        # Evita u == 1 al redondear a float32 (rompería log(1 - u))
+        np.minimum(out, np.nextafter(out.dtype.type(1), out.dtype.type(0)), out=out)
+        return out if shape else out[()]
+
+    def columns(self, n, dim, dtype=np.float64):
+        """Itera las `dim` coordenadas de los siguientes n puntos, una columna a la vez.
+
+        Equivale a las columnas de `random((n, dim))` pero con memoria O(n): cada
+        columna reutiliza el mismo buffer, válido hasta el siguiente paso.
+        """
+        n, dim = int(n), int(dim)
+        if self.max_dim is not None and dim > self.max_dim:
+            raise ValueError(f'{type(self).__name__} admite hasta {self.max_dim} dimensiones')
+        idx = np.arange(self.index, self.index + n, dtype=np.uint64)
+        self.index += n
+        return self._iter_columns(idx, dim, np.dtype(dtype))
+
+    def _iter_columns(self, idx, dim, dtype):
+        col = np.empty(idx.size, dtype=dtype)
+        top = np.nextafter(dtype.type(1), dtype.type(0))
+        for j in range(dim):
+            col[...] = self._coordinate(j, idx)
+            np.minimum(col, top, out=col)
+            yield col
+
+
+class SobolSequence(QuasiRandomSource):
+    """Sucesión de Sobol en base 2 (hasta 16 dimensiones), con aleatorización
+    opcional por mezcla lineal matricial + desplazamiento digital."""
+
+    max_dim = len(_SOBOL_DIRECTIONS) + 1
+
+    def __init__(self, scramble=True, seed=None):
+        super().__init__()
+        self.directions = _sobol_direction_numbers(self.max_dim)
+        self.shift = np.zeros(self.max_dim, dtype=np.uint64)
+        if scramble:
+            gen = as_generator(seed)
+            for j in range(self.max_dim):
+                self.directions[j] = self._linear_scramble(self.directions[j], gen)
+            self.shift = gen.integers(0, 2**_SOBOL_BITS, size=self.max_dim, dtype=np.uint64)
+
+    @staticmethod
+    def _linear_scramble(v, gen):
+        # L triangular inferior con diagonal unitaria; el dígito i (desde el más
+        # significativo) pasa a ser la paridad de los dígitos 0..i filtrados por la fila i de L
+        rows = []
+        for i in range(_SOBOL_BITS):
+            row = 1 << (_SOBOL_BITS - 1 - i)
+            for k in range(i):
+                if gen.random() < 0.5:
+                    row |= 1 << (_SOBOL_BITS - 1 - k)
+            rows.append(row)
+        out = np.zeros_like(v)
+        for col, vk in enumerate(v.tolist()):
+            x = 0
+            for i, row in enumerate(rows):
+                x |= (bin(vk & row).count('1') & 1) << (_SOBOL_BITS - 1 - i)
+            out[col] = x
+        return out
+
+    def _coordinate(self, j, idx):
+        gray = idx ^ (idx >> np.uint64(1))
+        x = np.full(idx.shape, self.shift[j], dtype=np.uint64)
+        for k in range(_SOBOL_BITS):
+            bit = (gray >> np.uint64(k)) & np.uint64(1)
+            x ^= bit * self.directions[j, k]
+        return x * (1.0 / 2**_SOBOL_BITS)
+
+
+class HaltonSequence(QuasiRandomSource):
+    """Sucesión de Halton (una base prima por dimensión), con permutación
+    aleatoria de dígitos opcional. Admite cualquier número de dimensiones."""
+
+    def __init__(self, scramble=True, seed=None):
+        super().__init__()
+        self.scramble = scramble
+        self._gen = as_generator(seed)
+        self._bases = []
+        self._perms = []
+
+    def _ensure_dims(self, dim):
+        if len(self._bases) >= dim:
+            return
+        self._bases = _primes(dim)
+        while len(self._perms) < dim:
+            b = self._bases[len(self._perms)]
+            perm = self._gen.permutation(b) if self.scramble else np.arange(b)
+            self._perms.append(perm.astype(np.float64))
+
+    def _coordinate(self, j, idx):
+        self._ensure_dims(j + 1)
+        b, perm = self._bases[j], self._perms[j]
+        n = idx.astype(np.int64)
+        x = np.zeros(n.shape)
+        f = 1.0 / b
+        ndigits = 1
+        top = int(n.max()) if n.size else 0
+        while b ** ndigits <= top:
+            ndigits += 1
+        for _ in range(ndigits):
+            x += perm[n % b] * f
+            n //= b
+            f /= b
+        # Los infinitos ceros finales también se permutan: su aporte es una serie geométrica
+        x += perm[0] * f * b / (b - 1)
+        return x
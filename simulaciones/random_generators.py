@@ -1,101 +1,858 @@
+import functools
 import math
-import random
 import numpy as np
 
+from quasi_random import QuasiRandomSource
+from random_stream import as_generator
+
+
+def _uniform_source(rng):
+    # Los métodos por transformada inversa aceptan también una fuente cuasi-aleatoria
+    if isinstance(rng, QuasiRandomSource):
+        return rng
+    return as_generator(rng)
+
+
+def _output(out, size, dtype):
+    """Devuelve (arreglo de salida, vista 1-D) reutilizando `out` si se pasó."""
+    if out is None:
+        out = np.empty(int(size), dtype=dtype)
+    elif not out.flags.c_contiguous:
+        raise ValueError('out debe ser un arreglo C-contiguo')
+    return out, out.reshape(-1)
+
+
+_ERLANG_GAMMA_THRESHOLD = 12
+
+
+def _erlang_log_product(columns, k, out):
+    """out <- sum(log(1 - u_j)) sobre k columnas uniformes, con memoria O(len(out)).
+
+    Se multiplican grupos de uniformes antes de un único log por grupo; el tamaño
+    del grupo evita el underflow del producto (1 - u >= 2^-53 en float64).
+    """
+    group = 16 if out.dtype.itemsize >= 8 else 4
+    prod = np.empty_like(out)
+    out.fill(0)
+    for j, u in enumerate(columns):
+        if j % group == 0:
+            np.subtract(1, u, out=prod)
+        else:
+            np.subtract(1, u, out=u)
+            prod *= u
+        if j % group == group - 1 or j == k - 1:
+            np.log(prod, out=prod)
+            out += prod
+    return out
+
+
+def _gamma_marsaglia_tsang(gen, a, out):
+    """Marsaglia-Tsang por bloques (a >= 1): solo se re-muestrean los rechazados."""
+    d = a - 1.0 / 3.0
+    c = 1.0 / math.sqrt(9.0 * d)
+    pending = np.arange(out.size)
+    while pending.size:
+        m = pending.size
+        x = gen.standard_normal(m)
+        v = 1.0 + c * x
+        u = gen.random(m)
+        valid = v > 0
+        v = np.where(valid, v, 1.0) ** 3
+        x2 = x * x
+        accept = valid & (u < 1 - 0.0331 * x2 * x2)
+        slow = valid & ~accept
+        accept[slow] = np.log(u[slow]) < 0.5 * x2[slow] + d * (1 - v[slow] + np.log(v[slow]))
+        out[pending[accept]] = d * v[accept]
+        pending = pending[~accept]
+
+
+def _normal_box_muller(gen, out):
+    size = out.size
+    half = (size + 1) // 2
+    r = np.sqrt(-2.0 * np.log1p(-gen.random(half)))
+    theta = 2 * np.pi * gen.random(half)
+    out[:half] = r * np.cos(theta)
+    out[half:] = (r * np.sin(theta))[:size - half]
+
+
+def _normal_polar(gen, out):
+    """Box-Muller polar (Marsaglia) sobre arreglos: cada par aceptado da dos normales."""
+    size = out.size
+    filled = 0
+    while filled < size:
+        # La tasa de aceptación es pi/4; se sobredimensiona el bloque para casi siempre terminar en una pasada
+        pairs = int((size - filled) / 2 / (np.pi / 4) * 1.02) + 16
+        u = 2.0 * gen.random(pairs) - 1.0
+        v = 2.0 * gen.random(pairs) - 1.0
+        s = u * u + v * v
+        ok = (s > 0) & (s < 1)
+        u, v, s = u[ok], v[ok], s[ok]
+        f = np.sqrt(-2.0 * np.log(s) / s)
+        z = np.concatenate((u * f, v * f))
+        take = min(z.size, size - filled)
+        out[filled:filled + take] = z[:take]
+        filled += take
+
+
+_NORMAL_METHODS = {
+    'polar': _normal_polar,
+    'box_muller': _normal_box_muller,
+}
+
+
+_LOG_FACTORIAL_TABLE = np.array([math.lgamma(k + 1.0) for k in range(128)])
+
+
+def _log_factorial(k):
+    """log(k!) vectorizado: tabla exacta para k < 128 y serie de Stirling para el resto."""
+    k = np.asarray(k, dtype=np.float64)
+    small = k < _LOG_FACTORIAL_TABLE.size
+    out = np.empty_like(k)
+    out[small] = _LOG_FACTORIAL_TABLE[k[small].astype(np.int64)]
+    x = k[~small] + 1.0
+    inv = 1.0 / x
+    inv2 = inv * inv
+    out[~small] = ((x - 0.5) * np.log(x) - x + 0.5 * math.log(2 * math.pi)
+                   + inv * (1.0 / 12 - inv2 * (1.0 / 360 - inv2 / 1260)))
+    return out
+
+
+def _iteration_limit(a):
+    # Cerca de x ~ a la serie y la fracción continua necesitan O(sqrt(a)) términos
+    return 10000 + int(20 * math.sqrt(a))
+
+
+def _gamma_p_scalar(a, x):
+    """P(a, x) regularizada: serie para x < a+1, fracción continua (Lentz) en otro caso."""
+    if x <= 0:
+        return 0.0
+    log_front = -x + a * math.log(x) - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        ap = a
+        for _ in range(_iteration_limit(a)):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-15:
+                break
+        return min(1.0, total * math.exp(log_front))
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, _iteration_limit(a)):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return max(0.0, 1.0 - math.exp(log_front) * h)
+
+
+def _beta_i_scalar(a, b, x):
+    """I_x(a, b) regularizada por fracción continua (Lentz), con I_x(a, b) = 1 - I_{1-x}(b, a)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - _beta_i_scalar(b, a, 1.0 - x)
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1)
+    d = 1 / (tiny if abs(d) < tiny else d)
+    h = d
+    for m in range(1, _iteration_limit(max(a, b))):
+        for an in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                   -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + an * d
+            d = 1 / (tiny if abs(d) < tiny else d)
+            c = 1 + an / c
+            c = tiny if abs(c) < tiny else c
+            delta = d * c
+            h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return min(1.0, math.exp(log_front) * h / a)
+
+
+# Sólo se evalúan en bordes de bins (O(bins)), así que basta vectorizar la versión escalar
+regularized_gamma_p = np.vectorize(_gamma_p_scalar, otypes=[np.float64])
+regularized_beta = np.vectorize(_beta_i_scalar, otypes=[np.float64])
+_normal_cdf = np.vectorize(lambda z: 0.5 * math.erfc(-z / math.sqrt(2)), otypes=[np.float64])
+
+
+class AliasTable:
+    """Tabla alias de Walker/Vose: construcción O(K), cada muestra O(1)."""
+
+    def __init__(self, pmf):
+        pmf = np.asarray(pmf, dtype=np.float64).ravel()
+        if pmf.size == 0 or np.any(pmf < 0) or not np.isfinite(pmf).all():
+            raise ValueError('pmf debe ser un vector no vacío de probabilidades >= 0')
+        total = pmf.sum()
+        if total <= 0:
+            raise ValueError('pmf debe tener masa positiva')
+        k = pmf.size
+        scaled = pmf * (k / total)
+        self.prob = np.ones(k)
+        self.alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Lo que queda (por redondeo) tiene probabilidad 1 de quedarse en su columna
+        self.size = k
+
+    def sample(self, gen, out):
+        """Rellena `out` (1-D) con índices en [0, K)."""
+        u = gen.random(out.size)
+        u *= self.size
+        col = u.astype(np.int64)
+        np.minimum(col, self.size - 1, out=col)
+        u -= col
+        np.copyto(out, np.where(u < self.prob[col], col, self.alias[col]), casting='unsafe')
+
+
+@functools.lru_cache(maxsize=64)
+def _alias_from_bytes(pmf_bytes):
+    return AliasTable(np.frombuffer(pmf_bytes, dtype=np.float64))
+
+
+def alias_table(pmf):
+    """AliasTable cacheada por el contenido exacto de la pmf."""
+    return _alias_from_bytes(np.ascontiguousarray(pmf, dtype=np.float64).tobytes())
+
+
+_POISSON_PTRS_THRESHOLD = 10.0
+
+
+@functools.lru_cache(maxsize=64)
+def _poisson_alias(lam):
+    # pmf truncada donde la cola es despreciable
+    kmax = int(lam + 12 * math.sqrt(lam) + 20)
+    k = np.arange(kmax + 1)
+    return AliasTable(np.exp(k * math.log(lam) - lam - _log_factorial(k)))
+
+
+def _poisson_alias_sample(gen, lam, out):
+    _poisson_alias(float(lam)).sample(gen, out)
+
+
+def _poisson_ptrs(gen, lam, out):
+    """Rechazo transformado de Hörmann (PTRS) por bloques, válido para lam >= 10."""
+    slam = math.sqrt(lam)
+    loglam = math.log(lam)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    invalpha = 1.1239 + 1.1328 / (b - 3.4)
+    vr = 0.9277 - 3.6224 / (b - 2)
+    pending = np.arange(out.size)
+    while pending.size:
+        m = pending.size
+        u = gen.random(m) - 0.5
+        v = gen.random(m)
+        us = 0.5 - np.abs(u)
+        k = np.floor((2 * a / us + b) * u + lam + 0.43)
+        accept = (us >= 0.07) & (v <= vr)
+        slow = ~accept & (k >= 0) & ~((us < 0.013) & (v > us))
+        ks = k[slow]
+        accept[slow] = (np.log(v[slow] * invalpha / (a / (us[slow] * us[slow]) + b))
+                        <= -lam + ks * loglam - _log_factorial(ks))
+        out[pending[accept]] = k[accept]
+        pending = pending[~accept]
+
+
+_BINOMIAL_BTRS_THRESHOLD = 10.0
+_BINOMIAL_ALIAS_MAX_N = 256
+_BINOMIAL_BLOCK = 2 ** 16
+
+
+@functools.lru_cache(maxsize=64)
+def _binomial_alias(n, p):
+    k = np.arange(n + 1)
+    return AliasTable(np.exp(_log_factorial(n) - _log_factorial(k) - _log_factorial(n - k)
+                             + k * math.log(p) + (n - k) * math.log1p(-p)))
+
+
+def _at(x, idx):
+    # Las constantes son escalares con p común y arrays con p por elemento
+    return x if np.ndim(x) == 0 else x[idx]
+
+
+def _binomial_inversion(gen, n, q, out):
+    """Inversión secuencial vectorizada para n*q < 10 (q escalar o por elemento); escribe en out."""
+    r = q / (1.0 - q)
+    pk = np.exp(n * np.log1p(-q))
+    u = gen.random(out.size)
+    out[...] = 0
+    active = np.flatnonzero(u > pk)
+    k = 0
+    while active.size and k < n:
+        k += 1
+        u[active] -= _at(pk, active)
+        if np.ndim(pk):
+            pk[active] *= r[active] * (n - k + 1) / k
+        else:
+            pk *= r * (n - k + 1) / k
+        out[active] = k
+        active = active[u[active] > _at(pk, active)]
+    return out
+
+
+def _binomial_btrs(gen, n, q, out):
+    """Rechazo transformado de Hörmann (BTRS), coste independiente de n; requiere n*q >= 10.
+
+    q puede ser escalar o por elemento; escribe en out.
+    """
+    spq = np.sqrt(n * q * (1.0 - q))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * q
+    c = n * q + 0.5
+    vr = 0.92 - 4.2 / b
+    alpha = (2.83 + 5.1 / b) * spq
+    lpq = np.log(q / (1.0 - q))
+    m = np.floor((n + 1) * q)
+    h = _log_factorial(m) + _log_factorial(n - m)
+    pending = np.arange(out.size)
+    while pending.size:
+        bb, aa = _at(b, pending), _at(a, pending)
+        u = gen.random(pending.size) - 0.5
+        v = gen.random(pending.size)
+        us = 0.5 - np.abs(u)
+        k = np.floor((2 * aa / us + bb) * u + _at(c, pending))
+        inside = (k >= 0) & (k <= n)
+        accept = inside & (us >= 0.07) & (v <= _at(vr, pending))
+        slow = np.flatnonzero(inside & ~accept)
+        ks, j = k[slow], pending[slow]
+        accept[slow] = (np.log(v[slow] * _at(alpha, j) / (_at(aa, slow) / (us[slow] * us[slow]) + _at(bb, slow)))
+                        <= _at(h, j) - _log_factorial(ks) - _log_factorial(n - ks) + (ks - _at(m, j)) * _at(lpq, j))
+        out[pending[accept]] = k[accept]
+        pending = pending[~accept]
+    return out
+
+
 class RandomGenerators:
+    # Todos los métodos aceptan out= (se rellena in situ y se devuelve) y dtype=;
+    # con out, el tamaño y el tipo se toman del propio arreglo. uniform, exponential,
+    # erlang y weibull aceptan además como rng una SobolSequence/HaltonSequence.
     @staticmethod
-    def uniform(a=0.0, b=1.0, size=1):
-        u = np.random.random(size)
-        return a + (b - a) * u
+    def uniform(a=0.0, b=1.0, size=1, rng=None, out=None, dtype=np.float64):
+        gen = _uniform_source(rng)
+        out, flat = _output(out, size, dtype)
+        gen.random(out=flat, dtype=flat.dtype)
+        flat *= (b - a)
+        flat += a
+        return out
 
     @staticmethod
-    def exponential(lam=1.0, size=1):
-        u = np.random.random(size)
-        return -np.log(1 - u) / lam
+    def exponential(lam=1.0, size=1, rng=None, out=None, dtype=np.float64):
+        gen = _uniform_source(rng)
+        out, flat = _output(out, size, dtype)
+        gen.random(out=flat, dtype=flat.dtype)
+        np.subtract(1, flat, out=flat)
+        np.log(flat, out=flat)
+        flat *= -1.0 / lam
+        return out
 
     @staticmethod
-    def erlang(k=1, lam=1.0, size=1):
+    def erlang(k=1, lam=1.0, size=1, rng=None, out=None, dtype=np.float64):
+        gen = _uniform_source(rng)
         if k <= 0:
             raise ValueError('k debe ser entero positivo')
-        u = np.random.random((size, k))
-        exps = -np.log(1 - u) / lam
-        return np.sum(exps, axis=1)
+        out, flat = _output(out, size, dtype)
+        if isinstance(gen, QuasiRandomSource):
+            # Cada punto de la sucesión aporta sus k coordenadas, columna a columna
+            _erlang_log_product(gen.columns(flat.size, k, flat.dtype), k, flat)
+        elif k > _ERLANG_GAMMA_THRESHOLD:
+            RandomGenerators.gamma(k, 1.0, rng=gen, out=flat)
+            flat /= lam
+            return out
+        else:
+            buf = np.empty_like(flat)
+            _erlang_log_product((gen.random(dtype=flat.dtype, out=buf) for _ in range(k)), k, flat)
+        flat *= -1.0 / lam
+        return out
 
     @staticmethod
-    def gamma(shape, scale=1.0, size=1):
-        size = int(size)
+    def gamma(shape, scale=1.0, size=1, rng=None, out=None, dtype=np.float64):
+        gen = as_generator(rng)
         a = shape
-        if a <= 0:
-            raise ValueError('shape must be > 0')
-        out = np.zeros(size)
-        for i in range(size):
-            if a < 1:
-                g = RandomGenerators.gamma(a + 1, scale=1.0, size=1)[0]
-                u = np.random.random()
-                out[i] = g * (u ** (1.0 / a))
-            else:
-                d = a - 1.0/3.0
-                c = 1.0 / math.sqrt(9.0 * d)
-                while True:
-                    x = np.random.normal()
-                    v = 1.0 + c * x
-                    if v <= 0:
-                        continue
-                    v = v**3
-                    u = np.random.random()
-                    if u < 1 - 0.0331 * (x**4):
-                        out[i] = d * v
-                        break
-                    if math.log(u) < 0.5 * x**2 + d * (1 - v + math.log(v)):
-                        out[i] = d * v
-                        break
-        return out * scale
+        if not math.isfinite(a) or a <= 0:
+            raise ValueError('shape must be finite and > 0')
+        out, flat = _output(out, size, dtype)
+        if a < 1:
+            # Boost: X ~ Gamma(a+1) => X * U^(1/a) ~ Gamma(a)
+            _gamma_marsaglia_tsang(gen, a + 1.0, flat)
+            u = gen.random(flat.size)
+            np.log(u, out=u)
+            u /= a
+            np.exp(u, out=u)
+            flat *= u
+        else:
+            _gamma_marsaglia_tsang(gen, a, flat)
+        flat *= scale
+        return out
 
     @staticmethod
-    def normal(mu=0.0, sigma=1.0, size=1):
-        size = int(size)
-        out = np.zeros(size)
-        i = 0
-        while i < size:
-            u1 = random.random()
-            u2 = random.random()
-            z0 = math.sqrt(-2.0 * math.log(u1)) * math.cos(2 * math.pi * u2)
-            z1 = math.sqrt(-2.0 * math.log(u1)) * math.sin(2 * math.pi * u2)
-            out[i] = mu + sigma * z0
-            i += 1
-            if i < size:
-                out[i] = mu + sigma * z1
-                i += 1
+    def normal(mu=0.0, sigma=1.0, size=1, method='polar', rng=None, out=None, dtype=np.float64):
+        gen = as_generator(rng)
+        if method not in _NORMAL_METHODS:
+            raise ValueError(f'Método normal no soportado: {method}')
+        out, flat = _output(out, size, dtype)
+        _NORMAL_METHODS[method](gen, flat)
+        flat *= sigma
+        flat += mu
         return out
 
     @staticmethod
-    def weibull(k=1.0, lam=1.0, size=1):
-        u = np.random.random(int(size))
-        return lam * ((-np.log(1 - u)) ** (1.0 / k))
+    def weibull(k=1.0, lam=1.0, size=1, rng=None, out=None, dtype=np.float64):
+        gen = _uniform_source(rng)
+        out, flat = _output(out, size, dtype)
+        gen.random(out=flat, dtype=flat.dtype)
+        np.subtract(1, flat, out=flat)
+        np.log(flat, out=flat)
+        np.negative(flat, out=flat)
+        np.power(flat, 1.0 / k, out=flat)
+        flat *= lam
+        return out
 
     @staticmethod
-    def bernoulli(p=0.5, size=1):
-        u = np.random.random(int(size))
-        return (u < p).astype(int)
+    def bernoulli(p=0.5, size=1, rng=None, out=None, dtype=np.int64):
+        gen = as_generator(rng)
+        out, flat = _output(out, size, dtype)
+        np.less(gen.random(flat.size), p, out=flat, casting='unsafe')
+        return out
 
     @staticmethod
-    def binomial(n=1, p=0.5, size=1):
-        size = int(size)
-        out = np.zeros(size, dtype=int)
-        for i in range(n):
-            out += RandomGenerators.bernoulli(p, size=size)
+    def binomial(n=1, p=0.5, size=1, rng=None, out=None, dtype=np.int64):
+        gen = as_generator(rng)
+        n = int(n)
+        if n < 0:
+            raise ValueError('n debe ser entero >= 0')
+        out, flat = _output(out, size, dtype)
+        size = flat.size
+        if np.ndim(p) == 0:
+            p = float(p)
+            if not 0 <= p <= 1:
+                raise ValueError('p debe estar en [0, 1]')
+            if 0 < p < 1 and n <= _BINOMIAL_ALIAS_MAX_N:
+                # Soporte pequeño: búsqueda en tabla alias
+                _binomial_alias(n, p).sample(gen, flat)
+                return out
+            # p común: constantes escalares y bloques acotados, sin copiar p al tamaño de la salida
+            q = min(p, 1.0 - p)
+            if q == 0:
+                flat[...] = 0
+            else:
+                method = _binomial_btrs if n * q >= _BINOMIAL_BTRS_THRESHOLD else _binomial_inversion
+                for start in range(0, size, _BINOMIAL_BLOCK):
+                    method(gen, n, q, flat[start:start + _BINOMIAL_BLOCK])
+            if p > 0.5:
+                np.subtract(n, flat, out=flat)
+            return out
+        # p puede tener la forma de out (o ser difundible a ella); se trabaja sobre la vista plana
+        p = np.broadcast_to(np.asarray(p, dtype=np.float64), out.shape).ravel()
+        if np.any((p < 0) | (p > 1)):
+            raise ValueError('p debe estar en [0, 1]')
+        # Por simetría se muestrea con q = min(p, 1-p) y se refleja al final
+        flip = p > 0.5
+        q = np.where(flip, 1.0 - p, p)
+        flat[...] = 0
+        rejection = n * q >= _BINOMIAL_BTRS_THRESHOLD
+        idx = np.flatnonzero(~rejection & (q > 0))
+        if idx.size:
+            flat[idx] = _binomial_inversion(gen, n, q[idx], np.empty(idx.size, dtype=np.int64))
+        idx = np.flatnonzero(rejection)
+        if idx.size:
+            flat[idx] = _binomial_btrs(gen, n, q[idx], np.empty(idx.size, dtype=np.int64))
+        flat[flip] = n - flat[flip]
         return out
 
     @staticmethod
-    def poisson(lam=1.0, size=1):
-        size = int(size)
-        out = np.zeros(size, dtype=int)
-        for i in range(size):
-            L = math.exp(-lam)
-            k = 0
-            p = 1.0
-            while p > L:
-                k += 1
-                p *= random.random()
-            out[i] = k - 1
-        return out
\ No newline at end of file
+    def poisson(lam=1.0, size=1, rng=None, out=None, dtype=np.int64):
+        gen = as_generator(rng)
+        if not math.isfinite(lam) or lam < 0:
+            raise ValueError('lam debe ser finito y >= 0')
+        out, flat = _output(out, size, dtype)
+        if lam == 0:
+            flat[...] = 0
+        elif lam < _POISSON_PTRS_THRESHOLD:
+            _poisson_alias_sample(gen, lam, flat)
+        else:
+            _poisson_ptrs(gen, lam, flat)
+        return out
+
+    @staticmethod
+    def discrete(pmf, values=None, size=1, rng=None, out=None, dtype=None):
+        """Distribución discreta arbitraria: índices 0..K-1, o `values[i]` si se pasan.
+
+        Sin `dtype` ni `out` la salida toma el tipo de `values` (int64 para los índices).
+        """
+        gen = as_generator(rng)
+        table = alias_table(pmf)
+        if values is not None:
+            values = np.asarray(values)
+            if len(values) != table.size:
+                raise ValueError('values debe tener la misma longitud que pmf')
+        if dtype is None:
+            dtype = np.int64 if values is None else values.dtype
+        out, flat = _output(out, size, dtype)
+        if values is None:
+            table.sample(gen, flat)
+        else:
+            if not np.can_cast(values.dtype, flat.dtype, casting='same_kind'):
+                raise ValueError(f'values ({values.dtype}) no cabe sin pérdida en la salida ({flat.dtype})')
+            idx = np.empty(flat.size, dtype=np.int64)
+            table.sample(gen, idx)
+            np.take(values.astype(flat.dtype, copy=False), idx, out=flat, mode='clip')
+        return out
+
+    @staticmethod
+    def stream(dist, params=None, total=1, chunk=2**20, rng=None, dtype=None):
+        """Genera `total` muestras en bloques de a lo sumo `chunk`.
+
+        Cada bloque es una vista de un mismo buffer reutilizado: el consumidor
+        debe procesarlo (o copiarlo) antes de pedir el siguiente.
+        """
+        spec = get_distribution(dist)
+        params = dict(params or {})
+        total = int(total)
+        chunk = int(chunk)
+        if chunk <= 0:
+            raise ValueError('chunk debe ser > 0')
+        if dtype is None:
+            dtype = spec.dtype
+        gen = _uniform_source(rng)
+        buf = np.empty(min(chunk, total), dtype=dtype)
+        remaining = total
+        while remaining > 0:
+            m = min(chunk, remaining)
+            yield spec.sample(rng=gen, out=buf[:m], **params)
+            remaining -= m
+
+
+class Param:
+    """Esquema de un parámetro: tipo, valor por defecto, cotas y alias aceptados."""
+
+    def __init__(self, name, kind=float, default=None, low=None, high=None, strict=False, aliases=()):
+        self.name = name
+        self.kind = kind
+        self.default = default
+        self.low = low
+        self.high = high
+        self.strict = strict
+        self.aliases = tuple(aliases)
+
+    def coerce(self, value):
+        if self.kind == 'floats':
+            if isinstance(value, str):
+                value = [float(x) for x in value.split(';') if x.strip()]
+            value = [float(x) for x in np.ravel(value)]
+            if not value:
+                raise ValueError(f'{self.name} no puede estar vacío')
+            for x in value:
+                self._check(x)
+            return value
+        if self.kind is int:
+            value = float(value)
+            if math.isfinite(value):
+                value = int(value)
+        else:
+            value = self.kind(value)
+        self._check(value)
+        return value
+
+    def _check(self, value):
+        # NaN pasaría todas las comparaciones de abajo
+        if not math.isfinite(value):
+            raise ValueError(f'{self.name} debe ser un número finito')
+        if self.low is not None and (value <= self.low if self.strict else value < self.low):
+            raise ValueError(f'{self.name} debe ser {">" if self.strict else ">="} {self.low}')
+        if self.high is not None and value > self.high:
+            raise ValueError(f'{self.name} debe ser <= {self.high}')
+
+
+class Distribution:
+    """Entrada del registro: sampler(es), esquema de parámetros y ley analítica."""
+
+    def __init__(self, name, label, sampler, params, title, mean, variance, pdf, cdf=None,
+                 discrete=False, bins=50, quasi_random=False):
+        self.name = name
+        self.label = label
+        self.backends = {'default': sampler}
+        self.params = params
+        self._title = title
+        self._mean = mean
+        self._variance = variance
+        self._pdf = pdf
+        self._cdf = cdf
+        self.discrete = discrete
+        self.bins = bins
+        # Sólo los samplers por transformada inversa aceptan una QuasiRandomSource como rng
+        self.quasi_random = quasi_random
+        self.dtype = np.dtype(np.int64 if discrete else np.float64)
+
+    def parse(self, raw=None):
+        """Valida `raw` (dict, p. ej. del parser del GUI o de argparse) contra el esquema."""
+        raw = dict(raw or {})
+        out = {}
+        for p in self.params:
+            for key in (p.name,) + p.aliases:
+                if key in raw and raw[key] is not None:
+                    out[p.name] = p.coerce(raw[key])
+                    break
+            else:
+                if p.default is None:
+                    raise ValueError(f'Falta el parámetro {p.name}')
+                out[p.name] = p.coerce(p.default)
+        return out
+
+    def sample(self, size=1, rng=None, out=None, backend='default', **params):
+        if isinstance(rng, QuasiRandomSource) and not self.quasi_random:
+            raise ValueError(f'{self.label} no admite una sucesión cuasi-aleatoria como rng: '
+                             'sólo las distribuciones por transformada inversa '
+                             f'({", ".join(n for n, d in DISTRIBUTION_REGISTRY.items() if d.quasi_random)})')
+        return self.backends[backend](size=size, rng=rng, out=out, **params)
+
+    def title(self, params):
+        return self._title(params)
+
+    def mean(self, params):
+        return self._mean(params)
+
+    def variance(self, params):
+        return self._variance(params)
+
+    def pdf(self, x, params):
+        """Densidad (o pmf en los enteros, para las discretas) evaluada sobre un arreglo."""
+        return self._pdf(np.asarray(x, dtype=np.float64), params)
+
+    def cdf(self, x, params):
+        x = np.asarray(x, dtype=np.float64)
+        if self._cdf is not None:
+            return self._cdf(x, params)
+        # Discretas con soporte en los enteros >= 0 y sin cola cerrada: suma acumulada de la pmf
+        return _integer_cdf(x, lambda k: self.pdf(k, params))
+
+
+DISTRIBUTION_REGISTRY = {}
+
+
+def register_distribution(dist):
+    DISTRIBUTION_REGISTRY[dist.name] = dist
+    return dist
+
+
+def register_backend(dist_name, backend_name, sampler):
+    """Registra un sampler alternativo; debe aceptar size=, rng=, out= y los parámetros."""
+    get_distribution(dist_name).backends[backend_name] = sampler
+
+
+def get_distribution(name):
+    if name not in DISTRIBUTION_REGISTRY:
+        raise ValueError(f'Distribución no soportada: {name}')
+    return DISTRIBUTION_REGISTRY[name]
+
+
+def _on_support(x, mask, values):
+    out = np.zeros_like(x)
+    out[mask] = values[mask] if np.ndim(values) else values
+    return out
+
+
+def _gamma_pdf(x, shape, scale):
+    pos = x > 0
+    xs = np.where(pos, x, 1.0) / scale
+    return _on_support(x, pos, np.exp((shape - 1) * np.log(xs) - xs - math.lgamma(shape)) / scale)
+
+
+def _integer_support(x, low, high):
+    k = np.rint(x)
+    return (k == x) & (k >= low) & (k <= high), np.clip(k, low, high)
+
+
+def _binomial_pmf(x, n, p):
+    mask, k = _integer_support(x, 0, n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        logp = (_log_factorial(n) - _log_factorial(k) - _log_factorial(n - k)
+                + np.where(k > 0, k * np.log(p) if p > 0 else -np.inf, 0.0)
+                + np.where(n - k > 0, (n - k) * np.log1p(-p) if p < 1 else -np.inf, 0.0))
+    return _on_support(x, mask, np.exp(logp))
+
+
+def _poisson_pmf(x, lam):
+    mask, k = _integer_support(x, 0, np.inf)
+    with np.errstate(divide='ignore'):
+        logp = -lam - _log_factorial(k) + (k * math.log(lam) if lam > 0 else np.where(k > 0, -np.inf, 0.0))
+    return _on_support(x, mask, np.exp(logp))
+
+
+def _integer_cdf(x, pmf, tail=None):
+    """F(x) de una discreta sobre los enteros >= 0.
+
+    `tail(k)` da F(k - 1) en forma cerrada: sólo se suma la pmf entre el menor y el mayor
+    entero de x, O(bins) en los bordes de un histograma, reescalada para que cuadre con la
+    forma cerrada en ambos extremos. Con puntos muy dispersos se usa la forma cerrada en
+    cada uno, y sin `tail` la pmf se acumula desde 0.
+    """
+    k = np.floor(x)
+    out = np.zeros_like(x)
+    inside = k >= 0
+    if not inside.any():
+        return out
+    ks = k[inside]
+    lo, hi = (0 if tail is None else int(ks.min())), int(ks.max())
+    if tail is not None and hi - lo > max(4 * ks.size, 4096):
+        out[inside] = tail(ks + 1)
+        return out
+    cum = np.cumsum(pmf(np.arange(lo, hi + 1, dtype=np.float64)))
+    if tail is not None:
+        low, high = tail(np.array([lo, hi + 1]))
+        if cum[-1] > 0:
+            # Corrige el error acumulado de la pmf (log-factoriales grandes) con n o lam enormes
+            cum *= (high - low) / cum[-1]
+        cum += low
+    out[inside] = np.minimum(cum[(ks - lo).astype(np.int64)], 1.0)
+    return out
+
+
+def _poisson_tail(k, lam):
+    # F(k - 1) = Q(k, lam)
+    k = np.asarray(k, dtype=np.float64)
+    return np.where(k > 0, 1.0 - regularized_gamma_p(np.maximum(k, 1.0), lam), 0.0)
+
+
+def _binomial_tail(k, n, p):
+    # F(k - 1) = I_{1-p}(n - k + 1, k) para 0 < k <= n
+    k = np.asarray(k, dtype=np.float64)
+    body = regularized_beta(np.maximum(n - k + 1, 1.0), np.clip(k, 1.0, None), 1.0 - p)
+    return np.where(k <= 0, 0.0, np.where(k > n, 1.0, body))
+
+
+def _discrete_pmf(x, pmf):
+    pmf = np.asarray(pmf) / np.sum(pmf)
+    mask, k = _integer_support(x, 0, pmf.size - 1)
+    return _on_support(x, mask, pmf[k.astype(np.int64)])
+
+
+def _discrete_moments(pmf):
+    pmf = np.asarray(pmf) / np.sum(pmf)
+    k = np.arange(pmf.size)
+    mean = float(np.dot(k, pmf))
+    return mean, float(np.dot((k - mean) ** 2, pmf))
+
+
+register_distribution(Distribution(
+    'uniform', 'Uniforme', RandomGenerators.uniform,
+    [Param('a', float, 0.0), Param('b', float, 1.0)],
+    quasi_random=True,
+    title=lambda p: f"Uniforme U({p['a']}, {p['b']})",
+    mean=lambda p: (p['a'] + p['b']) / 2,
+    variance=lambda p: (p['b'] - p['a']) ** 2 / 12,
+    pdf=lambda x, p: _on_support(x, (x >= p['a']) & (x <= p['b']), 1.0 / (p['b'] - p['a'])),
+    cdf=lambda x, p: np.clip((x - p['a']) / (p['b'] - p['a']), 0.0, 1.0)))
+
+register_distribution(Distribution(
+    'exponential', 'Exponencial', RandomGenerators.exponential,
+    [Param('lam', float, 1.0, low=0, strict=True, aliases=('lambda',))],
+    quasi_random=True,
+    title=lambda p: f"Exponencial (λ = {p['lam']})",
+    mean=lambda p: 1.0 / p['lam'],
+    variance=lambda p: 1.0 / p['lam'] ** 2,
+    pdf=lambda x, p: _on_support(x, x >= 0, p['lam'] * np.exp(-p['lam'] * x)),
+    cdf=lambda x, p: -np.expm1(-p['lam'] * np.maximum(x, 0.0))))
+
+register_distribution(Distribution(
+    'erlang', 'Erlang', RandomGenerators.erlang,
+    [Param('k', int, 2, low=1), Param('lam', float, 1.0, low=0, strict=True, aliases=('lambda',))],
+    quasi_random=True,
+    title=lambda p: f"Erlang (k = {p['k']}, λ = {p['lam']})",
+    mean=lambda p: p['k'] / p['lam'],
+    variance=lambda p: p['k'] / p['lam'] ** 2,
+    pdf=lambda x, p: _gamma_pdf(x, p['k'], 1.0 / p['lam']),
+    cdf=lambda x, p: regularized_gamma_p(p['k'], p['lam'] * x)))
+
+register_distribution(Distribution(
+    'gamma', 'Gamma', RandomGenerators.gamma,
+    [Param('shape', float, 2.0, low=0, strict=True), Param('scale', float, 1.0, low=0, strict=True)],
+    title=lambda p: f"Gamma (shape = {p['shape']}, scale = {p['scale']})",
+    mean=lambda p: p['shape'] * p['scale'],
+    variance=lambda p: p['shape'] * p['scale'] ** 2,
+    pdf=lambda x, p: _gamma_pdf(x, p['shape'], p['scale']),
+    cdf=lambda x, p: regularized_gamma_p(p['shape'], x / p['scale'])))
+
+register_distribution(Distribution(
+    'normal', 'Normal', RandomGenerators.normal,
+    [Param('mu', float, 0.0), Param('sigma', float, 1.0, low=0, strict=True)],
+    title=lambda p: f"Normal N({p['mu']}, {p['sigma']**2})",
+    mean=lambda p: p['mu'],
+    variance=lambda p: p['sigma'] ** 2,
+    pdf=lambda x, p: np.exp(-0.5 * ((x - p['mu']) / p['sigma']) ** 2) / (p['sigma'] * math.sqrt(2 * math.pi)),
+    cdf=lambda x, p: _normal_cdf((x - p['mu']) / p['sigma'])))
+
+register_distribution(Distribution(
+    'weibull', 'Weibull', RandomGenerators.weibull,
+    [Param('k', float, 1.5, low=0, strict=True), Param('lam', float, 1.0, low=0, strict=True, aliases=('lambda',))],
+    quasi_random=True,
+    title=lambda p: f"Weibull (k = {p['k']}, λ = {p['lam']})",
+    mean=lambda p: p['lam'] * math.gamma(1 + 1.0 / p['k']),
+    variance=lambda p: p['lam'] ** 2 * (math.gamma(1 + 2.0 / p['k']) - math.gamma(1 + 1.0 / p['k']) ** 2),
+    pdf=lambda x, p: _on_support(x, x >= 0, (p['k'] / p['lam']) * (np.abs(x) / p['lam']) ** (p['k'] - 1)
+                                 * np.exp(-(np.abs(x) / p['lam']) ** p['k'])),
+    cdf=lambda x, p: -np.expm1(-(np.maximum(x, 0.0) / p['lam']) ** p['k'])))
+
+register_distribution(Distribution(
+    'bernoulli', 'Bernoulli', RandomGenerators.bernoulli,
+    [Param('p', float, 0.5, low=0, high=1)],
+    title=lambda p: f"Bernoulli (p = {p['p']})",
+    mean=lambda p: p['p'],
+    variance=lambda p: p['p'] * (1 - p['p']),
+    pdf=lambda x, p: _binomial_pmf(x, 1, p['p']),
+    cdf=lambda x, p: _integer_cdf(x, lambda k: _binomial_pmf(k, 1, p['p']),
+                                  lambda k: _binomial_tail(k, 1, p['p'])),
+    discrete=True, bins='integer'))
+
+register_distribution(Distribution(
+    'binomial', 'Binomial', RandomGenerators.binomial,
+    [Param('n', int, 10, low=0), Param('p', float, 0.5, low=0, high=1)],
+    title=lambda p: f"Binomial (n = {p['n']}, p = {p['p']})",
+    mean=lambda p: p['n'] * p['p'],
+    variance=lambda p: p['n'] * p['p'] * (1 - p['p']),
+    pdf=lambda x, p: _binomial_pmf(x, p['n'], p['p']),
+    cdf=lambda x, p: _integer_cdf(x, lambda k: _binomial_pmf(k, p['n'], p['p']),
+                                  lambda k: _binomial_tail(k, p['n'], p['p'])),
+    discrete=True, bins='integer'))
+
+register_distribution(Distribution(
+    'poisson', 'Poisson', RandomGenerators.poisson,
+    [Param('lam', float, 1.0, low=0, aliases=('lambda',))],
+    title=lambda p: f"Poisson (λ = {p['lam']})",
+    mean=lambda p: p['lam'],
+    variance=lambda p: p['lam'],
+    pdf=lambda x, p: _poisson_pmf(x, p['lam']),
+    cdf=lambda x, p: _integer_cdf(x, lambda k: _poisson_pmf(k, p['lam']),
+                                  lambda k: _poisson_tail(k, p['lam'])),
+    discrete=True, bins='integer'))
+
+register_distribution(Distribution(
+    'discrete', 'Discreta (pmf)', RandomGenerators.discrete,
+    [Param('pmf', 'floats', '0.5;0.5', low=0)],
+    title=lambda p: f"Discreta (K = {len(p['pmf'])})",
+    mean=lambda p: _discrete_moments(p['pmf'])[0],
+    variance=lambda p: _discrete_moments(p['pmf'])[1],
+    pdf=lambda x, p: _discrete_pmf(x, p['pmf']),
+    discrete=True, bins='integer'))
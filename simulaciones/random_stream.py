@@ -0,0 +1,64 @@
+import numpy as np
+
+
+BIT_GENERATORS = {
+    'pcg64': np.random.PCG64,
+    'pcg64dxsm': np.random.PCG64DXSM,
+    'philox': np.random.Philox,
+    'sfc64': np.random.SFC64,
+    'mt19937': np.random.MT19937,
+}
+
+
+class RandomStream:
+    """Flujo aleatorio reproducible: un numpy.random.Generator creado desde una semilla."""
+
+    def __init__(self, seed=None, bit_generator='pcg64'):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f'Generador de bits no soportado: {bit_generator}')
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_seq = seed
+        else:
+            self.seed_seq = np.random.SeedSequence(seed)
+        self.bit_generator = bit_generator
+        self.generator = np.random.Generator(BIT_GENERATORS[bit_generator](self.seed_seq))
+
+    @property
+    def seed(self):
+        return self.seed_seq.entropy
+
+    def spawn(self, k):
+        """Devuelve k flujos hijos estadísticamente independientes (uno por worker)."""
+        return [RandomStream(child, self.bit_generator) for child in self.seed_seq.spawn(int(k))]
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        return self.generator.random(size, dtype=dtype, out=out)
+
+    def standard_normal(self, size=None, dtype=np.float64, out=None):
+        return self.generator.standard_normal(size, dtype=dtype, out=out)
+
+    def integers(self, low, high=None, size=None):
+        return self.generator.integers(low, high, size=size)
+
+    def __repr__(self):
+        spawn = f', spawn_key={self.seed_seq.spawn_key}' if self.seed_seq.spawn_key else ''
+        return f'RandomStream(seed={self.seed}{spawn}, bit_generator={self.bit_generator!r})'
+
+
+_default_stream = RandomStream()
+
+
+def as_generator(rng=None):
+    """Normaliza rng (None, semilla, RandomStream o Generator) a un numpy.random.Generator."""
+    if rng is None:
+        return _default_stream.generator
+    if isinstance(rng, RandomStream):
+        return rng.generator
+    if isinstance(rng, np.random.Generator):
+        return rng
+    # Import diferido: quasi_random importa este módulo
+    from quasi_random import QuasiRandomSource
+    if isinstance(rng, QuasiRandomSource):
+        raise ValueError('Una sucesión cuasi-aleatoria sólo sirve como rng de los samplers por '
+                         'transformada inversa (quasi_random=True en el registro)')
+    return RandomStream(rng).generator
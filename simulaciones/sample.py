@@ -0,0 +1,101 @@
+# sample.py
+"""Muestreador por línea de comandos, sin GUI ni matplotlib.
+
+Ejemplos:
+    python -m simulaciones.sample normal --mu 0 --sigma 1 -n 1e9 -o out.npy
+    python sample.py poisson --lam 4 -n 1e8 -o out.bin --format raw --workers 8 --seed 1
+"""
+import argparse
+import os
+import sys
+import time
+
+# Los módulos del proyecto se importan sin paquete (como en las apps)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from npy_writer import NpyWriter, sample_to_npy
+from random_generators import RandomGenerators, DISTRIBUTION_REGISTRY, get_distribution
+from random_stream import RandomStream
+
+FORMATS = ('npy', 'raw', 'memmap')
+
+
+def _count(text):
+    return int(float(text))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Genera muestras aleatorias y las escribe a disco.')
+    sub = parser.add_subparsers(dest='dist', required=True, metavar='distribución')
+    for name, spec in DISTRIBUTION_REGISTRY.items():
+        p = sub.add_parser(name, help=spec.label)
+        for param in spec.params:
+            kind = str if param.kind == 'floats' else param.kind
+            flags = [f'--{param.name}'] + [f'--{a}' for a in param.aliases]
+            p.add_argument(*flags, dest=param.name, type=kind, default=None,
+                           help=f'por defecto {param.default}')
+        p.add_argument('-n', '--size', type=_count, required=True, help='número de muestras (acepta 1e9)')
+        p.add_argument('-o', '--output', required=True, help='archivo de salida')
+        p.add_argument('--format', choices=FORMATS, default=None,
+                       help='npy (por defecto si termina en .npy), raw o memmap (.npy escrito vía mmap)')
+        p.add_argument('--dtype', default=None, help='tipo de salida, p. ej. float32')
+        p.add_argument('--chunk', type=_count, default=2**20, help='muestras por bloque')
+        p.add_argument('--seed', type=int, default=None)
+        p.add_argument('--workers', type=int, default=1, help='procesos de muestreo')
+        p.add_argument('--bit-generator', default='pcg64')
+    return parser
+
+
+def _blocks(args, params, dtype):
+    if args.workers <= 1:
+        rng = RandomStream(args.seed, args.bit_generator)
+        yield from RandomGenerators.stream(args.dist, params, args.size, args.chunk, rng=rng, dtype=dtype)
+        return
+    from parallel_sampler import ParallelSampler
+    batch = args.chunk * args.workers
+    with ParallelSampler(args.workers, args.seed, args.bit_generator, args.chunk) as sampler:
+        remaining = args.size
+        while remaining > 0:
+            block = sampler.sample(args.dist, params, min(batch, remaining))
+            yield block if block.dtype == dtype else block.astype(dtype)
+            remaining -= block.size
+            del block
+            sampler.discard()
+
+
+def write_samples(args):
+    spec = get_distribution(args.dist)
+    params = spec.parse({p.name: getattr(args, p.name) for p in spec.params})
+    dtype = np.dtype(args.dtype) if args.dtype else spec.dtype
+    fmt = args.format or ('npy' if args.output.endswith('.npy') else 'raw')
+    if fmt == 'memmap':
+        if args.workers <= 1:
+            sample_to_npy(args.dist, params, args.size, args.output, args.chunk,
+                          rng=RandomStream(args.seed, args.bit_generator), dtype=dtype)
+            return
+        with NpyWriter(args.output, args.size, dtype) as writer:
+            for block in _blocks(args, params, dtype):
+                writer.write(block)
+        return
+    with open(args.output, 'wb') as f:
+        if fmt == 'npy':
+            np.lib.format.write_array_header_1_0(
+                f, {'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False, 'shape': (args.size,)})
+        for block in _blocks(args, params, dtype):
+            block.tofile(f)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+    write_samples(args)
+    elapsed = time.perf_counter() - start
+    rate = args.size / elapsed if elapsed > 0 else float('inf')
+    print(f'{args.size} muestras de {args.dist} -> {args.output} en {elapsed:.2f} s '
+          f'({rate:.3g} muestras/s)', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from sample_stats import StreamingHistogram
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        return tuple(value.ravel().tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _nbytes(value):
+    if isinstance(value, StreamingHistogram):
+        return 0 if value.counts is None else value.counts.nbytes + 128
+    return value.nbytes
+
+
+class SampleCache:
+    """Caché LRU de muestras (ndarray) o de sus histogramas, con presupuesto en bytes.
+
+    El nivel en disco es opcional: con `disk_dir` cada entrada se guarda además como
+    .npy (muestras) o .npz (histogramas), de modo que sobrevive a reinicios de la
+    aplicación. Los archivos tienen su propio presupuesto (`disk_max_bytes`, por defecto
+    igual a `max_bytes`) y se descartan también por LRU, según su último uso.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, disk_dir=None, disk_max_bytes=None):
+        self.max_bytes = int(max_bytes)
+        self.disk_max_bytes = int(max_bytes if disk_max_bytes is None else disk_max_bytes)
+        self.nbytes = 0
+        self.disk_nbytes = 0
+        self._entries = OrderedDict()
+        self._files = OrderedDict()
+        self.set_disk_dir(disk_dir)
+
+    def set_disk_dir(self, disk_dir):
+        """Activa el nivel en disco sobre `disk_dir` (None lo desactiva)."""
+        self.disk_dir = disk_dir
+        self._files.clear()
+        self.disk_nbytes = 0
+        if disk_dir is None:
+            return
+        os.makedirs(disk_dir, exist_ok=True)
+        # Se retoman los archivos de sesiones anteriores, del menos al más recientemente usado
+        found = []
+        for name in os.listdir(disk_dir):
+            stem, ext = os.path.splitext(name)
+            if ext in ('.npy', '.npz') and len(stem) == 40:
+                path = os.path.join(disk_dir, name)
+                st = os.stat(path)
+                found.append((st.st_mtime, path, st.st_size))
+        for _, path, size in sorted(found):
+            self._files[path] = size
+            self.disk_nbytes += size
+        self._trim_disk()
+
+    @staticmethod
+    def key(dist, params, n, seed):
+        return (dist, _freeze(dict(params)), int(n), _freeze(seed))
+
+    def _path(self, key, ext):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.disk_dir, digest + ext)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        if self.disk_dir is None:
+            return None
+        value = self._load(key)
+        if value is not None:
+            self._store(key, value)
+        return value
+
+    def put(self, key, value):
+        if self.disk_dir is not None:
+            self._save(key, value)
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        size = _nbytes(value)
+        if key in self._entries:
+            self.nbytes -= _nbytes(self._entries.pop(key))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = value
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= _nbytes(evicted)
+
+    def _register_file(self, path):
+        size = os.path.getsize(path)
+        self.disk_nbytes += size - self._files.pop(path, 0)
+        self._files[path] = size
+        self._trim_disk()
+
+    def _touch(self, path):
+        os.utime(path)
+        if path in self._files:
+            self._files.move_to_end(path)
+        else:
+            self._register_file(path)
+
+    def _trim_disk(self):
+        while self.disk_nbytes > self.disk_max_bytes and self._files:
+            path, size = self._files.popitem(last=False)
+            self.disk_nbytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def _save(self, key, value):
+        if _nbytes(value) > self.disk_max_bytes:
+            return
+        if isinstance(value, StreamingHistogram):
+            if value.counts is None:
+                return
+            rng = value.range if value.range is not None else (np.nan, np.nan)
+            path = self._path(key, '.npz')
+            np.savez(path, counts=value.counts, bins=value.bins,
+                     range=np.array(rng), discrete=value.discrete, offset=value.offset,
+                     flow=np.array([value.underflow, value.overflow]),
+                     moments=np.array(value._moments, dtype=np.float64))
+        else:
+            path = self._path(key, '.npy')
+            np.save(path, value)
+        self._register_file(path)
+
+    def _load(self, key):
+        path = self._path(key, '.npy')
+        if os.path.exists(path):
+            self._touch(path)
+            return np.load(path)
+        path = self._path(key, '.npz')
+        if not os.path.exists(path):
+            return None
+        self._touch(path)
+        with np.load(path) as data:
+            rng = tuple(data['range'].tolist())
+            hist = StreamingHistogram(int(data['bins']), None if np.isnan(rng[0]) else rng,
+                                      bool(data['discrete']))
+            hist.counts = data['counts']
+            hist.offset = int(data['offset'])
+            hist.underflow, hist.overflow = (int(x) for x in data['flow'])
+            m = data['moments'].tolist()
+            hist._moments = (int(m[0]), m[1], m[2], m[3], m[4])
+        return hist
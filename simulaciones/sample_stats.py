@@ -0,0 +1,345 @@
+import numpy as np
+
+
+def _combine_moments(a, b):
+    """Combina (n, media, M2, M3, M4) de dos particiones (Chan/Pébay)."""
+    na, ma, m2a, m3a, m4a = a
+    nb, mb, m2b, m3b, m4b = b
+    if na == 0:
+        return b
+    if nb == 0:
+        return a
+    n = na + nb
+    delta = mb - ma
+    d_n = delta / n
+    mean = ma + d_n * nb
+    m2 = m2a + m2b + delta * d_n * na * nb
+    m3 = (m3a + m3b + delta * d_n * d_n * na * nb * (na - nb)
+          + 3 * d_n * (na * m2b - nb * m2a))
+    m4 = (m4a + m4b + delta * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+          + 6 * d_n * d_n * (na * na * m2b + nb * nb * m2a)
+          + 4 * d_n * (na * m3b - nb * m3a))
+    return n, mean, m2, m3, m4
+
+
+class StreamingHistogram:
+    """Histograma de bins fijos + momentos (Welford/Pébay) que consume bloques de muestras.
+
+    Para datos continuos el rango se fija con `range` o con el primer bloque; lo que cae
+    fuera se cuenta en `underflow`/`overflow`. Con `discrete=True` se usa un bin por
+    entero (np.bincount) y el soporte crece según llegan valores; `bins='integer'`
+    equivale a `discrete=True`.
+    """
+
+    def __init__(self, bins=50, range=None, discrete=False):
+        if bins == 'integer':
+            bins, discrete = 0, True
+        self.discrete = discrete
+        self.bins = int(bins)
+        self.range = None if range is None else (float(range[0]), float(range[1]))
+        self.counts = None
+        self.offset = 0
+        self.underflow = 0
+        self.overflow = 0
+        self._moments = (0, 0.0, 0.0, 0.0, 0.0)
+
+    @property
+    def n(self):
+        return self._moments[0]
+
+    @property
+    def mean(self):
+        return self._moments[1]
+
+    @property
+    def variance(self):
+        n, _, m2, _, _ = self._moments
+        return m2 / (n - 1) if n > 1 else float('nan')
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.variance))
+
+    @property
+    def skewness(self):
+        n, _, m2, m3, _ = self._moments
+        return float(np.sqrt(n) * m3 / m2 ** 1.5) if m2 > 0 else float('nan')
+
+    @property
+    def kurtosis(self):
+        """Curtosis en exceso (0 para la normal)."""
+        n, _, m2, _, m4 = self._moments
+        return n * m4 / (m2 * m2) - 3.0 if m2 > 0 else float('nan')
+
+    @property
+    def edges(self):
+        if self.counts is None:
+            return None
+        if self.discrete:
+            return np.arange(self.offset, self.offset + self.counts.size + 1)
+        return np.linspace(self.range[0], self.range[1], self.bins + 1)
+
+    def density(self):
+        total = self.counts.sum()
+        if total == 0:
+            return np.zeros(self.counts.size)
+        return self.counts / (total * np.diff(self.edges))
+
+    def copy(self):
+        other = StreamingHistogram(self.bins, self.range, self.discrete)
+        other.counts = None if self.counts is None else self.counts.copy()
+        other.offset = self.offset
+        other.underflow, other.overflow = self.underflow, self.overflow
+        other._moments = self._moments
+        return other
+
+    def update(self, block):
+        block = np.asarray(block).ravel()
+        if block.size == 0:
+            return self
+        mean = block.mean(dtype=np.float64)
+        d = block - mean
+        d2 = d * d
+        self._moments = _combine_moments(self._moments, (
+            block.size, float(mean), float(d2.sum()), float((d2 * d).sum()), float((d2 * d2).sum())))
+        if self.discrete:
+            self._update_discrete(block)
+        else:
+            self._update_continuous(block)
+        return self
+
+    def _update_continuous(self, block):
+        if self.range is None:
+            lo, hi = float(block.min()), float(block.max())
+            pad = 0.05 * (hi - lo) if hi > lo else 0.5
+            self.range = (lo - pad, hi + pad)
+        lo, hi = self.range
+        counts, _ = np.histogram(block, bins=self.bins, range=self.range)
+        if self.counts is None:
+            self.counts = counts.astype(np.int64)
+        else:
+            self.counts += counts
+        self.underflow += int(np.count_nonzero(block < lo))
+        self.overflow += int(np.count_nonzero(block > hi))
+
+    def _grow(self, lo, hi):
+        if self.counts is None:
+            self.offset = lo
+            self.counts = np.zeros(hi - lo + 1, dtype=np.int64)
+            return
+        new_lo = min(lo, self.offset)
+        new_hi = max(hi, self.offset + self.counts.size - 1)
+        if new_lo == self.offset and new_hi == self.offset + self.counts.size - 1:
+            return
+        grown = np.zeros(new_hi - new_lo + 1, dtype=np.int64)
+        grown[self.offset - new_lo:self.offset - new_lo + self.counts.size] = self.counts
+        self.offset, self.counts = new_lo, grown
+
+    def _update_discrete(self, block):
+        block = block.astype(np.int64, copy=False)
+        lo, hi = int(block.min()), int(block.max())
+        self._grow(lo, hi)
+        counts = np.bincount(block - lo, minlength=hi - lo + 1)
+        start = lo - self.offset
+        self.counts[start:start + counts.size] += counts
+
+    def merge(self, other):
+        """Suma los resultados parciales de otro acumulador (p. ej. de otro worker)."""
+        if other.discrete != self.discrete:
+            raise ValueError('No se pueden mezclar histogramas discretos y continuos')
+        if other.counts is not None:
+            if self.discrete:
+                self._grow(other.offset, other.offset + other.counts.size - 1)
+                start = other.offset - self.offset
+                self.counts[start:start + other.counts.size] += other.counts
+            elif self.counts is None:
+                self.bins, self.range = other.bins, other.range
+                self.counts = other.counts.copy()
+            elif self.bins != other.bins or self.range != other.range:
+                raise ValueError('Los histogramas deben tener los mismos bins para combinarse')
+            else:
+                self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self._moments = _combine_moments(self._moments, other._moments)
+        return self
+
+
+def _binned_cdf(hist, cdf):
+    # F en el borde superior de cada bin (y en el inferior del primero); en las discretas
+    # el borde e cierra el entero e - 1
+    edges = hist.edges.astype(np.float64)
+    return np.asarray(cdf(edges - 1.0 if hist.discrete else edges), dtype=np.float64)
+
+
+def kolmogorov_sf(x):
+    """P(K > x) de la distribución asintótica de Kolmogorov."""
+    if x <= 0:
+        return 1.0
+    k = np.arange(1, 101)
+    return float(np.clip(2.0 * np.sum((-1.0) ** (k - 1) * np.exp(-2.0 * k * k * x * x)), 0.0, 1.0))
+
+
+def binned_ks(hist, cdf):
+    """Estadístico D de Kolmogorov-Smirnov evaluado sólo en los bordes del histograma.
+
+    Devuelve (D, p). Con datos agrupados o discretos D es una cota inferior del D exacto
+    y el p-valor resulta conservador.
+    """
+    n = hist.n
+    if n == 0 or hist.counts is None:
+        return float('nan'), float('nan')
+    empirical = (hist.underflow + np.concatenate(([0], np.cumsum(hist.counts)))) / n
+    d = float(np.max(np.abs(empirical - _binned_cdf(hist, cdf))))
+    sqrt_n = np.sqrt(n)
+    return d, kolmogorov_sf((sqrt_n + 0.12 + 0.11 / sqrt_n) * d)
+
+
+def binned_chi_square(hist, cdf, min_expected=5.0):
+    """Prueba chi-cuadrado de Pearson sobre los bins (más las dos colas).
+
+    Los bins con frecuencia esperada menor que `min_expected` se fusionan con sus vecinos.
+    Devuelve (estadístico, grados de libertad, p).
+    """
+    from random_generators import regularized_gamma_p
+
+    n = hist.n
+    if n == 0 or hist.counts is None:
+        return float('nan'), 0, float('nan')
+    f = _binned_cdf(hist, cdf)
+    expected = n * np.diff(np.concatenate(([0.0], f, [1.0])))
+    observed = np.concatenate(([hist.underflow], hist.counts, [hist.overflow])).astype(np.float64)
+    # Fusión voraz de izquierda a derecha; el resto incompleto se suma al último grupo
+    groups_e, groups_o = [], []
+    acc_e = acc_o = 0.0
+    for e, o in zip(expected, observed):
+        acc_e += e
+        acc_o += o
+        if acc_e >= min_expected:
+            groups_e.append(acc_e)
+            groups_o.append(acc_o)
+            acc_e = acc_o = 0.0
+    if groups_e:
+        groups_e[-1] += acc_e
+        groups_o[-1] += acc_o
+    dof = len(groups_e) - 1
+    if dof < 1:
+        return float('nan'), 0, float('nan')
+    e = np.array(groups_e)
+    o = np.array(groups_o)
+    stat = float(np.sum((o - e) ** 2 / e))
+    return stat, dof, float(1.0 - regularized_gamma_p(dof / 2.0, stat / 2.0))
+
+
+class BinnedKDE:
+    """Estimación de densidad por núcleo gaussiano sobre una grilla fina, en O(n + G log G).
+
+    Las muestras se reparten por binning lineal entre los dos nodos vecinos de la grilla
+    a medida que llegan los bloques; `evaluate` convoluciona los pesos con el núcleo por
+    FFT. El rango se fija con `range` o con el primer bloque, igual que StreamingHistogram.
+    """
+
+    def __init__(self, grid=2048, range=None):
+        self.grid = int(grid)
+        if self.grid < 2:
+            raise ValueError('grid debe ser >= 2')
+        self.range = None if range is None else (float(range[0]), float(range[1]))
+        self.weights = np.zeros(self.grid, dtype=np.float64)
+        self.outside = 0
+        self._moments = (0, 0.0, 0.0, 0.0, 0.0)
+
+    @property
+    def n(self):
+        return self._moments[0]
+
+    @property
+    def std(self):
+        n, _, m2, _, _ = self._moments
+        return float(np.sqrt(m2 / (n - 1))) if n > 1 else float('nan')
+
+    @property
+    def x(self):
+        return np.linspace(self.range[0], self.range[1], self.grid)
+
+    @property
+    def step(self):
+        return (self.range[1] - self.range[0]) / (self.grid - 1)
+
+    def copy(self):
+        other = BinnedKDE(self.grid, self.range)
+        other.weights = self.weights.copy()
+        other.outside = self.outside
+        other._moments = self._moments
+        return other
+
+    def update(self, block):
+        block = np.asarray(block, dtype=np.float64).ravel()
+        if block.size == 0:
+            return self
+        mean = block.mean()
+        d = block - mean
+        d2 = d * d
+        self._moments = _combine_moments(self._moments, (
+            block.size, float(mean), float(d2.sum()), float((d2 * d).sum()), float((d2 * d2).sum())))
+        if self.range is None:
+            lo, hi = float(block.min()), float(block.max())
+            # Margen amplio: las colas del núcleo también deben caer dentro de la grilla
+            pad = 0.25 * (hi - lo) if hi > lo else 0.5
+            self.range = (lo - pad, hi + pad)
+        pos = (block - self.range[0]) / self.step
+        inside = (pos >= 0) & (pos <= self.grid - 1)
+        self.outside += int(block.size - np.count_nonzero(inside))
+        pos = pos[inside]
+        j = np.minimum(pos.astype(np.int64), self.grid - 2)
+        w = pos - j
+        self.weights += np.bincount(j, weights=1.0 - w, minlength=self.grid)
+        self.weights += np.bincount(j + 1, weights=w, minlength=self.grid)
+        return self
+
+    def merge(self, other):
+        if self.range is None:
+            self.grid, self.range = other.grid, other.range
+            self.weights = other.weights.copy()
+        elif other.range is not None:
+            if self.grid != other.grid or self.range != other.range:
+                raise ValueError('Las KDE deben tener la misma grilla para combinarse')
+            self.weights += other.weights
+        self.outside += other.outside
+        self._moments = _combine_moments(self._moments, other._moments)
+        return self
+
+    def _iqr(self):
+        # Cuartiles aproximados a partir de la grilla ya acumulada
+        cum = np.cumsum(self.weights)
+        q1, q3 = np.interp([0.25 * cum[-1], 0.75 * cum[-1]], cum, self.x)
+        return float(q3 - q1)
+
+    def bandwidth(self, rule='silverman'):
+        n = self.n
+        if n < 2:
+            return float('nan')
+        sigma = self.std
+        if rule == 'scott':
+            return 1.059 * sigma * n ** -0.2
+        if rule == 'silverman':
+            iqr = self._iqr()
+            spread = min(sigma, iqr / 1.349) if iqr > 0 else sigma
+            return 0.9 * spread * n ** -0.2
+        raise ValueError(f'Regla de ancho de banda no soportada: {rule}')
+
+    def evaluate(self, bandwidth='silverman'):
+        """Devuelve (x, densidad) sobre la grilla; `bandwidth` es una regla o un número."""
+        if self.n == 0 or self.range is None:
+            return self.x if self.range is not None else np.empty(0), np.zeros(self.grid)
+        h = self.bandwidth(bandwidth) if isinstance(bandwidth, str) else float(bandwidth)
+        dx = self.step
+        half = min(int(np.ceil(4.0 * h / dx)), self.grid - 1)
+        offsets = np.arange(-half, half + 1) * dx
+        kernel = np.exp(-0.5 * (offsets / h) ** 2)
+        # Normalizado en la grilla para conservar la masa aun con h menor que dx
+        kernel /= kernel.sum() * dx
+        size = self.grid + kernel.size - 1
+        nfft = 1 << (size - 1).bit_length()
+        conv = np.fft.irfft(np.fft.rfft(self.weights, nfft) * np.fft.rfft(kernel, nfft), nfft)
+        density = np.maximum(conv[half:half + self.grid], 0.0) / self.n
+        return self.x, density
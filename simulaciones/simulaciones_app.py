@@ -10,8 +10,10 @@ from matplotlib.colors import ListedColormap
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from game_of_life_2d import GameOfLife2D
-from game_of_life_1d import GameOfLife1D
+from game_of_life_1d import SPACETIME_ROWS, GameOfLife1D, SpacetimeRing
 from covid_simulation import CovidSimulation
+from cycle_detector import cycle_note
+
 
 class SimulacionesApp:
     def __init__(self, root):
@@ -65,12 +67,13 @@ class SimulacionesApp:
         p = float(self.g2_p.get())
         self.g2 = GameOfLife2D(rows=rows, cols=cols)
         self.g2.randomize(p=p)
+        self.g2.track_cycles()
         self._g2_draw()
 
     def _g2_draw(self):
         self.g2_ax.clear()
         self.g2_ax.imshow(self.g2.grid, interpolation='nearest')
-        self.g2_ax.set_title('Juego de la Vida 2D')
+        self.g2_ax.set_title('Juego de la Vida 2D' + cycle_note(self.g2.cycles))
         self.g2_canvas.draw()
 
     def _g2_step(self):
@@ -93,12 +96,15 @@ class SimulacionesApp:
                 except Exception as e:
                     print('Error en loop GOL2D:', e)
                     self.g2_running = False
+                if self.g2.cycles is not None and self.g2.cycles.found:
+                    self.g2_running = False
         threading.Thread(target=loop, daemon=True).start()
 
     def _g2_clear(self):
         if self.g2 is None:
             self._g2_create_random()
         self.g2.grid = np.zeros_like(self.g2.grid)
+        self.g2.track_cycles()
         self._g2_draw()
 
     # ---------------- Game of Life 1D ----------------
@@ -143,7 +149,7 @@ def _build_gameoflife1d_tab(self):
     self.g1_canvas.get_tk_widget().pack(fill='both', expand=True)
 
     self.g1 = None
-    self.g1_history = []
+    self.g1_history = None
 
 def _update_rule_field(self, event):
     if self.g1_rule_var.get() == 'Regla personalizada':
@@ -161,23 +167,22 @@ def _g1_create(self):
     length = max(10, int(self.g1_length.get()))
     rule = int(self.g1_rule_var.get()) if self.g1_rule_var.get() != 'Regla personalizada' else self.custom_rule_var.get()
     self.g1 = GameOfLife1D(length, rule)
-    self.g1_history = [self.g1.state.copy()]
+    self.g1.track_cycles()
+    self.g1_history = SpacetimeRing(SPACETIME_ROWS, length)
+    self.g1_history.push(self.g1.state)
     self._g1_draw()
 
 def _g1_draw(self):
     self.g1_ax.clear()
-    img = np.array(self.g1_history)
+    img = self.g1_history.view()
     self.g1_ax.imshow(img, aspect='auto', interpolation='nearest')
-    self.g1_ax.set_title(f'Autómata 1D (Regla {self.g1.rule})')
+    self.g1_ax.set_title(f'Autómata 1D (Regla {self.g1.rule})' + cycle_note(self.g1.cycles))
     self.g1_canvas.draw()
 
 def _g1_step(self):
     if self.g1 is None:
         self._g1_create()
-    self.g1.step()
-    self.g1_history.append(self.g1.state.copy())
-    if len(self.g1_history) > 200:
-        self.g1_history.pop(0)
+    self.g1.run(1, out=self.g1_history)
     self._g1_draw()
 
 def _g1_run(self):
@@ -185,6 +190,8 @@ def _g1_run(self):
         for _ in range(200):
             time.sleep(0.05)
             self._g1_step()
+            if self.g1.cycles.found:
+                break
     threading.Thread(target=run_loop, daemon=True).start()
 
     # ---------------- COVID Tab ----------------
@@ -291,4 +298,4 @@ def main():
     root.mainloop()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()